@@ -1,6 +1,23 @@
-from . import toolbox
+import importlib
+
 from . import config
-from . import utils
 
 
 __all__ = ["utils", "config", "toolbox"]
+
+_LAZY_SUBMODULES = {"utils", "toolbox", "async_utils"}
+
+
+def __getattr__(name):
+    # Import psycopg2/pandas-backed modules on first access only, so that
+    # e.g. building a connection string does not pay for them.
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
@@ -0,0 +1,608 @@
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING, AsyncIterator, Callable, Iterable, List, Literal,
+    Optional, Sequence, Tuple, Union
+)
+from contextlib import asynccontextmanager
+from itertools import islice
+from nova_pg import toolbox
+import asyncio
+import uuid
+
+try:
+    import psycopg
+    from psycopg import sql
+except ImportError as e:
+    raise ImportError(
+        "nova_pg.async_utils requires psycopg 3: pip install 'nova-pg[async]'"
+    ) from e
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@asynccontextmanager
+async def _transaction(
+    conn: psycopg.AsyncConnection,
+    autocommit: bool = False,
+):
+    """Yield a cursor on ``conn``, committing on success and rolling back
+    on error. The cursor is closed on exit; the connection is left open.
+
+    With ``autocommit`` there is no transaction to end. The connection's
+    setting is only changed when it differs and is restored on exit."""
+    restore_autocommit = conn.autocommit
+    if restore_autocommit != autocommit:
+        await conn.set_autocommit(autocommit)
+
+    cur = conn.cursor()
+
+    try:
+        yield cur
+        if not autocommit:
+            await conn.commit()
+
+    except Exception:
+        if not autocommit:
+            await conn.rollback()
+        raise
+
+    finally:
+        await cur.close()
+
+        if restore_autocommit != autocommit and not conn.closed:
+            await conn.set_autocommit(restore_autocommit)
+
+
+@asynccontextmanager
+async def get_cursor(
+    database_url: Optional[str] = None,
+    *,
+    conn: Optional[psycopg.AsyncConnection] = None,
+    autocommit: bool = False,
+):
+    """Async context manager yielding a cursor with transaction handling.
+
+    Each block opens its own connection and closes it on exit. Pass ``conn``
+    to run the transaction on a connection the caller owns instead; it is
+    committed or rolled back but never closed. Blocks on different
+    connections run concurrently under one event loop. As in
+    ``nova_pg.utils.get_cursor``, ``autocommit=True`` commits each statement
+    as it runs instead of wrapping the block in a transaction.
+
+    Args:
+        database_url: PostgreSQL connection string.
+        conn: Open ``psycopg.AsyncConnection`` to use.
+        autocommit: Run the block's statements in autocommit mode.
+
+    Yields:
+        psycopg.AsyncCursor.
+
+    Raises:
+        ValueError: If neither ``database_url`` nor ``conn`` is given.
+        ConnectionError: If the connection cannot be established.
+        Propagates any exception from query execution.
+    """
+    if conn is not None:
+        async with _transaction(conn, autocommit) as cur:
+            yield cur
+
+        return
+
+    if database_url is None:
+        raise ValueError("get_cursor requires database_url or conn")
+
+    try:
+        own_conn = await psycopg.AsyncConnection.connect(
+            database_url, autocommit=autocommit
+        )
+    except psycopg.Error as e:
+        raise ConnectionError(f"Connection to db failed: {e}") from e
+
+    try:
+        async with _transaction(own_conn, autocommit) as cur:
+            yield cur
+
+    finally:
+        await own_conn.close()
+
+
+async def execute_query(
+    *,
+    cur,
+    query: Union[str, sql.Composable],
+) -> None:
+    """Execute a generic SQL statement.
+
+    Args:
+        cur: psycopg async cursor.
+        query: SQL statement, as a string or a ``psycopg.sql`` composition.
+
+    Raises:
+        psycopg.Error: On execution errors.
+    """
+    await cur.execute(query)
+
+
+async def execute_many(
+    *,
+    cur,
+    query: Union[str, sql.Composable],
+    argslist: Iterable[Sequence],
+) -> None:
+    """Execute a parameterized statement once per argument tuple.
+
+    psycopg 3 pipelines the executions, so they do not cost one round-trip
+    each.
+
+    Args:
+        cur: psycopg async cursor.
+        query: SQL statement with ``%s`` placeholders.
+        argslist: Parameters for each execution.
+
+    Raises:
+        psycopg.Error: On execution errors.
+    """
+    await cur.executemany(query, argslist)
+
+
+async def execute_values_many(
+    *,
+    cur,
+    query: Union[str, sql.Composable],
+    argslist: Iterable[Sequence],
+    template: Optional[str] = None,
+    page_size: int = 500,
+) -> None:
+    """Execute a statement with a single ``VALUES %s`` for many rows.
+
+    psycopg 3 has no ``execute_values``; as with psycopg2's, rows are
+    expanded ``page_size`` at a time into one multi-row ``VALUES`` list,
+    so an INSERT of N rows costs N / ``page_size`` statements.
+
+    Args:
+        cur: psycopg async cursor.
+        query: SQL statement containing a single ``%s`` placeholder,
+            e.g. ``INSERT INTO t (a, b) VALUES %s``.
+        argslist: Rows to expand into the ``VALUES`` list.
+        template: Row template such as ``"(%s, %s::jsonb)"``. Defaults to
+            one ``%s`` per row item.
+        page_size: Number of rows per statement.
+
+    Raises:
+        ValueError: If ``query`` does not hold exactly one ``%s``.
+        psycopg.Error: On execution errors.
+    """
+    if not isinstance(query, str):
+        query = query.as_string(cur.connection)
+
+    parts = query.split("%s")
+    if len(parts) != 2:
+        raise ValueError("query must contain exactly one %s placeholder")
+
+    rows = iter(argslist)
+    while True:
+        page = list(islice(rows, page_size))
+        if not page:
+            return
+
+        row_template = template or "({})".format(
+            ", ".join(["%s"] * len(page[0]))
+        )
+        await cur.execute(
+            parts[0] + ", ".join([row_template] * len(page)) + parts[1],
+            [value for row in page for value in row],
+        )
+
+
+async def execute_pipeline(
+    *,
+    conn: psycopg.AsyncConnection,
+    stmts: Sequence[Union[str, sql.Composable]],
+) -> List[Optional[List[Tuple]]]:
+    """Run a sequence of statements in one pipelined round-trip.
+
+    The statements are sent back to back in psycopg 3 pipeline mode and the
+    connection is synced once at the end, so a multi-step operation
+    (create schema, create table, create index, insert ... RETURNING) costs
+    one round-trip instead of one per statement. They run in the
+    connection's current transaction; commit it, e.g. by calling this
+    inside ``get_cursor(conn=conn)``, to keep the changes.
+
+    Args:
+        conn: Open ``psycopg.AsyncConnection``.
+        stmts: SQL statements to run, in order.
+
+    Returns:
+        One entry per statement: its rows, or None for statements without
+        a result set.
+
+    Raises:
+        psycopg.Error: On execution errors. Statements after the failing
+            one are not executed and the transaction is left aborted.
+    """
+    cursors = []
+
+    try:
+        async with conn.pipeline():
+            for stmt in stmts:
+                cur = conn.cursor()
+                cursors.append(cur)
+                await cur.execute(stmt)
+
+        return [
+            await cur.fetchall() if cur.description else None
+            for cur in cursors
+        ]
+
+    finally:
+        for cur in cursors:
+            await cur.close()
+
+
+async def run(
+    *,
+    cur,
+    query: Union[str, sql.Composable],
+    params: Optional[Sequence] = None,
+) -> Tuple[List[str], psycopg.AsyncCursor]:
+    """Execute a query once and hand back its columns and the cursor.
+
+    Args:
+        cur: psycopg async cursor.
+        query: SQL query.
+        params: Values bound to the query placeholders.
+
+    Returns:
+        Tuple of:
+            - List of column names (empty for statements without a result).
+            - The cursor, positioned before the first row.
+    """
+    await cur.execute(query, params)
+    column_names = [desc.name for desc in cur.description or ()]
+
+    return column_names, cur
+
+
+async def fetch_one(
+    *,
+    cur,
+    query: Union[str, sql.Composable],
+    params: Optional[Sequence] = None,
+) -> Tuple[List[str], Optional[Tuple]]:
+    """Execute a SELECT query and fetch the first row.
+
+    Args:
+        cur: psycopg async cursor.
+        query: SQL SELECT query.
+        params: Values bound to the query placeholders.
+
+    Returns:
+        Tuple of:
+            - List of column names.
+            - First row or None.
+
+    Raises:
+        psycopg.Error: On execution errors.
+    """
+    column_names, cur = await run(cur=cur, query=query, params=params)
+    return column_names, await cur.fetchone()
+
+
+async def fetch_many(
+    *,
+    cur,
+    query: str,
+    batch_size: int,
+) -> Tuple[List[str], List[Tuple]]:
+    """Execute a SELECT query and fetch up to batch_size rows.
+
+    Args:
+        cur: psycopg async cursor.
+        query: SQL SELECT query.
+        batch_size: Max number of rows to fetch.
+
+    Returns:
+        Tuple of:
+            - List of column names.
+            - List of rows.
+
+    Raises:
+        psycopg.Error: On execution errors.
+    """
+    column_names, cur = await run(cur=cur, query=query)
+    return column_names, await cur.fetchmany(batch_size)
+
+
+async def fetch_all(
+    *,
+    cur,
+    query: str,
+) -> Tuple[List[str], List[Tuple]]:
+    """Execute a SELECT query and fetch the entire result set.
+
+    Args:
+        cur: psycopg async cursor.
+        query: SQL SELECT query.
+
+    Returns:
+        Tuple of:
+            - List of column names.
+            - List of all rows.
+
+    Raises:
+        psycopg.Error: On execution errors.
+    """
+    column_names, cur = await run(cur=cur, query=query)
+    return column_names, await cur.fetchall()
+
+
+async def iter_rows(
+    *,
+    cur,
+    query: str,
+    batch_size: int = 1000,
+    server_side: bool = False,
+) -> AsyncIterator[Tuple]:
+    """Execute a SELECT query and yield its rows one at a time.
+
+    With ``server_side=True`` the query runs on a named cursor and only
+    ``batch_size`` rows are transferred per round-trip; the rows must then
+    be consumed inside the surrounding transaction.
+
+    Args:
+        cur: psycopg async cursor.
+        query: SQL SELECT query.
+        batch_size: Number of rows converted per ``fetchmany`` call.
+        server_side: Stream the result from a server-side cursor.
+
+    Yields:
+        One row per iteration.
+
+    Raises:
+        psycopg.Error: On execution or fetch errors.
+    """
+    if server_side:
+        cur = cur.connection.cursor(name=f"nova_chunked_{uuid.uuid4().hex}")
+        cur.itersize = batch_size
+
+    try:
+        await cur.execute(query)
+
+        while True:
+            batch = await cur.fetchmany(batch_size)
+            if not batch:
+                return
+
+            for row in batch:
+                yield row
+
+    finally:
+        if server_side:
+            await cur.close()
+
+
+async def fetch_in_chunks(
+    *,
+    cur,
+    query: str,
+    table_name: str,
+    batch_size: int = 1000,
+) -> Tuple[List[str], AsyncIterator[List[Tuple]]]:
+    """Execute a SELECT query and stream results in batches.
+
+    The query runs on a server-side (named) cursor opened on the connection
+    of ``cur``, so rows are transferred ``batch_size`` at a time. Consume
+    the batches before the surrounding ``get_cursor`` block exits.
+
+    Args:
+        cur: psycopg async cursor whose connection runs the query.
+        query: SQL SELECT query.
+        table_name: Table the query reads from.
+        batch_size: Number of rows per batch.
+
+    Returns:
+        Tuple of:
+            - List of column names.
+            - Async iterator over lists of at most ``batch_size`` rows.
+
+    Raises:
+        psycopg.Error: On execution or fetch errors.
+    """
+    named_cur = cur.connection.cursor(name=f"nova_chunked_{uuid.uuid4().hex}")
+    named_cur.itersize = batch_size
+
+    try:
+        await named_cur.execute(query)
+        column_names = [desc.name for desc in named_cur.description]
+
+    except Exception:
+        await named_cur.close()
+        raise
+
+    async def batches():
+        try:
+            while True:
+                batch = await named_cur.fetchmany(batch_size)
+                if not batch:
+                    return
+
+                yield batch
+
+        finally:
+            await named_cur.close()
+
+    return column_names, batches()
+
+
+async def create_schema(
+    *,
+    cur,
+    schema_name: str,
+) -> None:
+    """Create a schema if it does not already exist.
+
+    Args:
+        cur: psycopg async cursor.
+        schema_name: Schema name.
+
+    Raises:
+        RuntimeError: On execution errors.
+    """
+    try:
+        query = sql.SQL("CREATE SCHEMA IF NOT EXISTS {};").format(
+            sql.Identifier(schema_name)
+        )
+        await cur.execute(query)
+
+    except Exception as e:
+        raise RuntimeError(
+            f"Error creating schema '{schema_name}': {e}"
+        ) from e
+
+
+async def _copy_chunks(
+    *,
+    cur,
+    statement: sql.Composable,
+    chunks,
+    header: bytes = b"",
+    trailer: bytes = b"",
+    progress_callback: Optional[Callable[[int], None]],
+):
+    """Stream ``(rows_done, bytes)`` blocks into a ``COPY ... FROM STDIN``.
+
+    Blocks are serialized in a worker thread, so the event loop keeps
+    serving other tasks while a chunk is being encoded.
+    """
+    async with cur.copy(statement) as copy:
+        if header:
+            await copy.write(header)
+
+        while True:
+            item = await asyncio.to_thread(next, chunks, None)
+            if item is None:
+                break
+
+            end, data = item
+            await copy.write(data)
+
+            if progress_callback is not None:
+                progress_callback(end)
+
+        if trailer:
+            await copy.write(trailer)
+
+
+async def insert_dataframe(
+    *,
+    cur,
+    df: pd.DataFrame,
+    table_name: str,
+    schema: str,
+    chunksize: int = 5000,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    method: Literal["copy", "binary", "values"] = "copy",
+    require_nonempty: bool = False,
+) -> int:
+    """
+    Insert a pandas DataFrame into a target database table.
+
+    Async counterpart of ``toolbox.insert_dataframe``, with the same
+    methods and payload encoders. ``method="values"`` sends one
+    parameterized INSERT per row through psycopg 3's pipelined
+    ``executemany`` rather than ``execute_values``.
+
+    Parameters
+    ----------
+    cur : psycopg async cursor
+        Active database cursor.
+    df : pd.DataFrame
+        Rows to insert. Column names must match the target table.
+    table_name : str
+        Name of the target table.
+    schema : str
+        Schema containing the target table.
+    chunksize : int
+        Number of rows serialized per batch.
+    progress_callback : callable, optional
+        Called with the cumulative number of rows written after each batch.
+    method : {"copy", "binary", "values"}
+        Insert strategy. Defaults to "copy".
+    require_nonempty : bool
+        Raise ``ValueError`` for an empty ``df`` instead of returning 0.
+
+    Returns
+    -------
+    int
+        Number of rows inserted.
+    """
+    if df.empty:
+        if require_nonempty:
+            raise ValueError(
+                "The provided DataFrame is empty and cannot be inserted."
+            )
+
+        return 0
+
+    if method not in ("copy", "binary", "values"):
+        raise ValueError(f"Unsupported insert method '{method}'")
+
+    target = sql.SQL("{}.{} ({})").format(
+        sql.Identifier(schema),
+        sql.Identifier(table_name),
+        sql.SQL(", ").join(map(sql.Identifier, df.columns)),
+    )
+    encoding = cur.connection.info.encoding
+
+    try:
+        if method == "copy":
+            await _copy_chunks(
+                cur=cur,
+                statement=sql.SQL(
+                    "COPY {} FROM STDIN WITH CSV"
+                ).format(target),
+                chunks=toolbox._csv_chunks(df, chunksize, encoding),
+                progress_callback=progress_callback,
+            )
+
+        elif method == "binary":
+            await _copy_chunks(
+                cur=cur,
+                statement=sql.SQL(
+                    "COPY {} FROM STDIN WITH (FORMAT BINARY)"
+                ).format(target),
+                chunks=toolbox._binary_chunks(df, chunksize, encoding),
+                header=toolbox._BINARY_COPY_HEADER,
+                trailer=toolbox._BINARY_COPY_TRAILER,
+                progress_callback=progress_callback,
+            )
+
+        else:
+            statement = sql.SQL("INSERT INTO {} VALUES ({})").format(
+                target,
+                sql.SQL(", ").join([sql.Placeholder()] * df.shape[1]),
+            )
+
+            # Match the COPY path, where missing values are written as NULL.
+            if df.isna().values.any():
+                df = df.astype(object).where(df.notna(), None)
+
+            n_rows = len(df)
+            for start in range(0, n_rows, chunksize):
+                end = min(start + chunksize, n_rows)
+                await cur.executemany(
+                    statement,
+                    df.iloc[start:end].itertuples(index=False, name=None),
+                )
+
+                if progress_callback is not None:
+                    progress_callback(end)
+
+    except Exception as e:
+        raise RuntimeError(
+            f"Error inserting DataFrame into {schema}.{table_name}: {e}"
+        ) from e
+
+    return len(df)
@@ -1,13 +1,31 @@
 from contextlib import contextmanager
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Mapping
+from types import MappingProxyType
+from operator import itemgetter
 from pathlib import Path
-import json
+import functools
+
+try:
+    import orjson as _json
+    _loads = _json.loads
+except ImportError:
+    import json as _json
+    _loads = _json.loads
+
+
+_STANDARD_DB_KEYS: frozenset[str] = frozenset(
+    ("host", "port", "dbname", "user", "password")
+)
+
+_get_connection_fields = itemgetter(
+    "user", "password", "host", "port", "dbname", "sslmode", "channel_binding"
+)
 
 
 def _db_keys_check(
     *,
     db_cred_dict: Dict
-) -> Tuple[bool, set]:
+) -> Tuple[bool, frozenset]:
     """Validate that all required database credential keys are present in the
     provided dictionary.
 
@@ -22,56 +40,95 @@ def _db_keys_check(
         credentials.
 
     Returns:
-        Tuple[bool, set]:
+        Tuple[bool, frozenset]:
             - A boolean indicating whether all required keys are present.
             - A set of missing keys (empty if none are missing).
     """
-    standard_keys = {"host", "port", "dbname", "user", "password"}
-    dict_keys = db_cred_dict.keys()
-    all_keys_present = standard_keys.issubset(dict_keys)
-    missing_keys = standard_keys - dict_keys
+    missing_keys = _STANDARD_DB_KEYS.difference(db_cred_dict)
+
+    return not missing_keys, missing_keys
 
-    return all_keys_present, missing_keys
+
+@functools.lru_cache(maxsize=32)
+def _load_db_config_cached(
+    path_str: str,
+    mtime_ns: int,
+    env_name: str
+) -> Mapping:
+    """Parse and validate one environment section of a configuration file.
+
+    Results are memoized on (path, mtime, environment), so the file is only
+    re-read when it changes on disk. ``mtime_ns`` is part of the cache key
+    and is otherwise unused.
+
+    Args:
+        path_str (str): Resolved path to the JSON configuration file.
+        mtime_ns (int): Modification time of the file, in nanoseconds.
+        env_name (str): Environment name to load.
+
+    Returns:
+        Mapping: Read-only view of the database credentials.
+    """
+    with open(path_str, "rb") as f:
+        config = _loads(f.read())
+
+    db_cred = config.get(env_name)
+    if not db_cred:
+        raise KeyError(
+            f"Environment '{env_name}' not found in {path_str}"
+        )
+
+    all_keys_present, missing_keys = _db_keys_check(db_cred_dict=db_cred)
+    if not all_keys_present:
+        raise ValueError(f"Missing required keys: {missing_keys}")
+
+    return MappingProxyType(db_cred)
 
 
 def load_db_config(
     *,
     config_file_path: Path,
     env_name: str = "dev"
-) -> Dict:
+) -> Mapping:
     """Load database connection parameters from a JSON configuration file.
 
+    The parsed section is cached per file and environment, and the cache is
+    invalidated automatically when the file's modification time changes.
+
     Args:
         config_file_path (Path): Path to the JSON configuration file.
         env_name (str, optional): Environment name to load. Defaults to "dev".
 
     Returns:
-        Dict: Dictionary containing the database credentials.
+        Mapping: Read-only mapping containing the database credentials.
 
     Raises:
-        Exception: If the environment section is not found.
-        Exception: If any required key is missing.
-        Exception: If an error occurs while loading or parsing the
-        configuration file.
+        FileNotFoundError: If the configuration file does not exist.
+        ValueError: If the file is not valid JSON (``JSONDecodeError``).
+        KeyError: If the environment section is not found.
+        ValueError: If any required key is missing.
     """
-    try:
-        with open(config_file_path, "r") as f:
-            config = json.load(f)
+    p = Path(config_file_path).resolve()
+    st = p.stat()
 
-        db_cred = config.get(env_name)
-        if not db_cred:
-            raise Exception(
-                f"Environment '{env_name}' not found in {config_file_path}"
-            )
+    return _load_db_config_cached(str(p), st.st_mtime_ns, env_name)
 
-        all_keys_present, missing_keys = _db_keys_check(db_cred_dict=db_cred)
-        if not all_keys_present:
-            raise Exception(f"Missing required keys: {missing_keys}")
 
-        return db_cred
-
-    except Exception as e:
-        raise Exception(f"Error loading DB configuration: {e}")
+@functools.lru_cache(maxsize=8)
+def _build_connection_string_cached(
+    db_user: str,
+    db_password: str,
+    db_host: str,
+    db_port: int,
+    db_name: str,
+    sslmode: str,
+    channel_binding: str
+) -> str:
+    """Format a PostgreSQL connection string, memoized on its fields."""
+    return (
+        f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/"
+        f"{db_name}?sslmode={sslmode}&channel_binding={channel_binding}"
+    )
 
 
 def build_connection_string(
@@ -81,27 +138,27 @@ def build_connection_string(
     """
     Build a PostgreSQL connection string from a configuration dictionary.
 
+    Strings are cached per set of credentials. Since the cache holds
+    passwords, call ``build_connection_string.cache_clear()`` once the
+    credentials should no longer be kept in memory (e.g. on logout).
+
     Args:
         db_cred_dict (Dict): Database configuration containing 'host', 'port',
             'dbname', 'user', and 'password'.
 
     Returns:
         str: A valid PostgreSQL connection string.
-    """
-    all_keys_present, missing_keys = _db_keys_check(db_cred_dict=db_cred_dict)
-    
-    if not all_keys_present:
-        raise Exception(f"Missing required keys: {missing_keys}")
 
-    db_user = db_cred_dict["user"]
-    db_password = db_cred_dict["password"]
-    db_host = db_cred_dict["host"]
-    db_port = db_cred_dict["port"]
-    db_name = db_cred_dict["dbname"]
-    sslmode = db_cred_dict["sslmode"]
-    channel_binding = db_cred_dict["channel_binding"]
+    Raises:
+        ValueError: If any required key is missing.
+    """
+    missing_keys = _STANDARD_DB_KEYS.difference(db_cred_dict)
+    if missing_keys:
+        raise ValueError(f"Missing required keys: {missing_keys}")
 
-    return (
-        f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/"
-        f"{db_name}?sslmode={sslmode}&channel_binding={channel_binding}"
+    return _build_connection_string_cached(
+        *_get_connection_fields(db_cred_dict)
     )
+
+
+build_connection_string.cache_clear = _build_connection_string_cached.cache_clear
@@ -1,6 +1,597 @@
-import pandas as pd
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING, Callable, Iterator, List, Literal, Optional, Tuple, Union
+)
+from itertools import chain, repeat
+from functools import lru_cache
+from psycopg2.extras import execute_values
+from psycopg2 import sql
+from types import MappingProxyType
+import psycopg2
+import codecs
 import nova_pg
-import io
+import threading
+import struct
+import os
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+# Bytes moved per pipe write and per COPY data message; psycopg2 and
+# io default to 8 KiB, which means many more syscalls per megabyte.
+_COPY_BLOCK_SIZE = 64 * 1024
+
+_PG_TYPE_MAP = MappingProxyType({
+    "int": sql.SQL("BIGINT"),
+    "float": sql.SQL("DOUBLE PRECISION"),
+    "decimal": sql.SQL("NUMERIC"),
+    "bool": sql.SQL("BOOLEAN"),
+    "str": sql.SQL("TEXT"),
+    "bytes": sql.SQL("BYTEA"),
+    "datetime": sql.SQL("TIMESTAMPTZ"),
+    "date": sql.SQL("DATE"),
+    "time": sql.SQL("TIME"),
+    "timedelta": sql.SQL("INTERVAL"),
+})
+
+
+# PostgreSQL binary COPY framing.
+_BINARY_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + bytes(8)
+_BINARY_COPY_TRAILER = struct.pack(">h", -1)
+_BINARY_NULL = struct.pack(">i", -1)
+_PACK_FIELD_LENGTH = struct.Struct(">i").pack
+
+# (dtype kind, itemsize) -> length-prefixed field layout.
+_BINARY_FIXED_FORMATS = MappingProxyType({
+    ("b", 1): ">i?",
+    ("i", 2): ">ih",
+    ("i", 4): ">ii",
+    ("i", 8): ">iq",
+    ("f", 4): ">if",
+    ("f", 8): ">id",
+})
+
+# Microseconds between the Unix epoch and the PostgreSQL epoch (2000-01-01).
+_PG_EPOCH_OFFSET_US = 946_684_800_000_000
+
+
+def _client_encoding(cur) -> str:
+    """Python codec matching the client encoding of the cursor's connection."""
+    return psycopg2.extensions.encodings.get(
+        cur.connection.encoding, "utf-8"
+    )
+
+
+def _pg_timestamps(series: pd.Series):
+    """Microseconds since the PostgreSQL epoch of a datetime64 column.
+
+    Tz-aware values are converted to UTC; NaT entries are undefined.
+    """
+    if getattr(series.dt, "tz", None) is not None:
+        series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+
+    micros = series.to_numpy(dtype="datetime64[us]").view("int64")
+    return micros - _PG_EPOCH_OFFSET_US
+
+
+@lru_cache(maxsize=256)
+def _binary_row_layout(dtypes: Tuple) -> Optional[np.dtype]:
+    """
+    Build the numpy record layout of a binary COPY row for fixed dtypes.
+
+    Parameters
+    ----------
+    dtypes : tuple
+        Column dtypes of the frame being inserted.
+
+    Returns
+    -------
+    np.dtype or None
+        Structured dtype holding the field count, then length and
+        big-endian value per column, or None when a column is not
+        fixed-width.
+
+    Notes
+    -----
+    Cached per dtype tuple, so repeated inserts into the same table work
+    out the layout once instead of per chunk and per call.
+    """
+    import numpy as np
+
+    layout = [("n", ">i2")]
+    for i, dtype in enumerate(dtypes):
+        # pandas extension dtypes such as StringDtype have no itemsize.
+        key = (dtype.kind, getattr(dtype, "itemsize", None))
+        if dtype.kind == "M":
+            code = ">q"
+        elif key in _BINARY_FIXED_FORMATS:
+            code = ">" + _BINARY_FIXED_FORMATS[key][-1]
+        else:
+            return None
+
+        layout += [(f"l{i}", ">i4"), (f"v{i}", code)]
+
+    return np.dtype(layout)
+
+
+def _binary_fixed_columns(
+    df: pd.DataFrame,
+) -> Optional[Tuple[np.dtype, List[np.ndarray], Optional[np.ndarray]]]:
+    """
+    Extract the columns of a fixed-width frame as numpy arrays, once.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Rows to insert.
+
+    Returns
+    -------
+    tuple or None
+        The row layout from ``_binary_row_layout``, one array per column and
+        a boolean mask of rows holding a missing value (None when there are
+        none), or None when a column is not fixed-width.
+
+    Notes
+    -----
+    Numeric columns are returned as views of the frame's data where
+    possible; only datetimes are converted up front.
+    """
+    import numpy as np
+
+    layout = _binary_row_layout(tuple(df.dtypes))
+    if layout is None:
+        return None
+
+    columns = []
+    missing = None
+    for i in range(df.shape[1]):
+        series = df.iloc[:, i]
+        if series.hasnans:
+            is_missing = series.isna().to_numpy()
+            missing = is_missing if missing is None else missing | is_missing
+
+        if series.dtype.kind == "M":
+            columns.append(_pg_timestamps(series))
+        elif isinstance(series.dtype, np.dtype):
+            columns.append(series.to_numpy())
+        else:
+            # Nullable extension arrays; masked rows are not encoded here.
+            columns.append(series.to_numpy(
+                dtype=layout[f"v{i}"].newbyteorder("="), na_value=0
+            ))
+
+    return layout, columns, missing
+
+
+def _binary_rows_fixed(
+    layout: np.dtype,
+    columns: List[np.ndarray],
+) -> bytes:
+    """
+    Encode rows of fixed-width columns with whole-column numpy copies.
+
+    Parameters
+    ----------
+    layout : np.dtype
+        Row layout from ``_binary_row_layout``.
+    columns : list of np.ndarray
+        Equal-length column slices without missing values.
+
+    Returns
+    -------
+    bytes
+        The encoded rows.
+
+    Notes
+    -----
+    Every row is laid out as a numpy structured record, so each column is
+    written with a single vectorized assignment (which also swaps it to
+    big-endian) instead of one ``struct.pack`` call per cell.
+    """
+    import numpy as np
+
+    rows = np.empty(len(columns[0]), dtype=layout)
+    rows["n"] = len(columns)
+    for i, column in enumerate(columns):
+        rows[f"l{i}"] = layout[f"v{i}"].itemsize
+        rows[f"v{i}"] = column
+
+    return rows.tobytes()
+
+
+def _binary_fields(
+    series: pd.Series,
+    encoding: str,
+) -> List[bytes]:
+    """
+    Encode a column as length-prefixed binary COPY fields.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Column to encode.
+    encoding : str
+        Codec used for text values.
+
+    Returns
+    -------
+    list of bytes
+        One encoded field per row; missing values become NULL.
+
+    Notes
+    -----
+    - bool, int16/32/64 and float32/64 map to BOOLEAN, SMALLINT/INTEGER/
+      BIGINT and REAL/DOUBLE PRECISION; the target column must have exactly
+      that type.
+    - datetime64 maps to TIMESTAMP, or TIMESTAMPTZ when tz-aware.
+    - object and string columns must hold ``str`` values and map to TEXT.
+    """
+    dtype = series.dtype
+    kind = dtype.kind
+    size = getattr(dtype, "itemsize", None)
+    missing = series.isna().tolist()
+
+    if (kind, size) in _BINARY_FIXED_FORMATS:
+        pack = struct.Struct(_BINARY_FIXED_FORMATS[(kind, size)]).pack
+        return [
+            _BINARY_NULL if is_missing else pack(size, value)
+            for value, is_missing in zip(series.tolist(), missing)
+        ]
+
+    if kind == "M":
+        pack = struct.Struct(">iq").pack
+        return [
+            _BINARY_NULL if is_missing else pack(8, value)
+            for value, is_missing in zip(
+                _pg_timestamps(series).tolist(), missing
+            )
+        ]
+
+    if kind == "O":
+        fields = []
+        for value, is_missing in zip(series.tolist(), missing):
+            if is_missing:
+                fields.append(_BINARY_NULL)
+            elif isinstance(value, str):
+                data = value.encode(encoding)
+                fields.append(_PACK_FIELD_LENGTH(len(data)) + data)
+            else:
+                raise TypeError(
+                    f"Column '{series.name}' holds a "
+                    f"{type(value).__name__} value; binary COPY only "
+                    f"supports str in object columns"
+                )
+
+        return fields
+
+    raise TypeError(
+        f"Unsupported dtype '{dtype}' for binary COPY "
+        f"in column '{series.name}'"
+    )
+
+
+class _CopySource:
+    """Read end of a COPY pipe that fails instead of signalling EOF when
+    the writer raised, so ``copy_expert`` aborts the COPY with CopyFail
+    rather than committing the rows sent so far."""
+
+    def __init__(self, file, errors: List[BaseException]):
+        self._file = file
+        self._errors = errors
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        if not data and self._errors:
+            raise self._errors[0]
+
+        return data
+
+
+def _copy_from_writer(
+    *,
+    cur,
+    statement: Union[str, sql.Composable],
+    write,
+):
+    """Run a COPY ... FROM STDIN fed by ``write`` through an OS pipe.
+
+    ``write`` receives a binary file object and runs on a thread of its
+    own, so serialization (much of it in pandas, pyarrow or numpy code that
+    releases the GIL) overlaps with ``copy_expert`` sending data to the
+    server and only the pipe buffer is held in memory. The thread is not
+    shared: it blocks on the pipe whenever the COPY does, e.g. while the
+    table is locked, and must not hold up other inserts.
+
+    Parameters
+    ----------
+    cur : psycopg cursor
+        Database cursor used to execute the COPY.
+    statement : str or sql.Composable
+        COPY statement reading from STDIN.
+    write : callable
+        Function writing the encoded COPY payload to the file object it
+        receives.
+
+    Notes
+    -----
+    If ``write`` fails, its error is raised from the reader once the data
+    written so far has been consumed, which makes psycopg2 abort the COPY:
+    none of the payload is stored, even in autocommit mode or when the
+    caller handles the error and commits.
+    """
+    r_fd, w_fd = os.pipe()
+    reader = os.fdopen(r_fd, "rb")
+    writer = os.fdopen(w_fd, "wb", buffering=_COPY_BLOCK_SIZE)
+    errors = []
+
+    def produce():
+        try:
+            write(writer)
+        except BrokenPipeError:
+            # The reader went away; the COPY error takes precedence.
+            pass
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            try:
+                writer.close()
+            except BrokenPipeError:
+                pass
+
+    thread = threading.Thread(
+        target=produce, name="nova_pg_copy", daemon=True
+    )
+    thread.start()
+
+    try:
+        cur.copy_expert(
+            sql=statement,
+            file=_CopySource(reader, errors),
+            size=_COPY_BLOCK_SIZE,
+        )
+
+    except psycopg2.Error:
+        if errors:
+            # Surface the serializer error rather than the CopyFail it
+            # caused.
+            raise errors[0]
+        raise
+
+    finally:
+        reader.close()
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+# Statement per insert method, formatted with schema, table and columns.
+_INSERT_TEMPLATES = MappingProxyType({
+    "copy": sql.SQL("COPY {}.{} ({}) FROM STDIN WITH CSV"),
+    "binary": sql.SQL("COPY {}.{} ({}) FROM STDIN WITH (FORMAT BINARY)"),
+    "values": sql.SQL("INSERT INTO {}.{} ({}) VALUES %s"),
+})
+
+
+@lru_cache(maxsize=256)
+def _insert_statement(
+    method: str,
+    schema: str,
+    table_name: str,
+    columns: Tuple[str, ...],
+) -> sql.Composed:
+    """Compose the insert statement for a target, once per column layout.
+
+    ETL loops insert many frames with the same schema; caching skips
+    rebuilding one ``sql.Identifier`` per column on every call.
+    """
+    return _INSERT_TEMPLATES[method].format(
+        sql.Identifier(schema),
+        sql.Identifier(table_name),
+        sql.SQL(", ").join(map(sql.Identifier, columns)),
+    )
+
+
+def _import_arrow_csv():
+    """Return ``(pyarrow, pyarrow.csv)``, or ``None`` without pyarrow."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+
+    return pa, pacsv
+
+
+def _csv_chunks(
+    df: pd.DataFrame,
+    chunksize: int,
+    encoding: str,
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Serialize ``df`` as CSV COPY payload, ``chunksize`` rows at a time.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Rows to serialize.
+    chunksize : int
+        Number of rows per yielded block.
+    encoding : str
+        Codec of the connection the payload is sent to.
+
+    Yields
+    ------
+    tuple of (int, bytes)
+        Number of rows serialized so far and the encoded block.
+
+    Notes
+    -----
+    When pyarrow is installed and ``encoding`` is UTF-8, the frame is
+    converted to an Arrow table once and each chunk is serialized by
+    Arrow's C++ CSV writer. Frames Arrow cannot convert or write fall back
+    to ``DataFrame.to_csv`` from the failing chunk onwards. So do frames
+    with timedelta columns: Arrow writes durations as bare nanosecond
+    counts, which PostgreSQL would read as seconds.
+    """
+    table = None
+    arrow = None
+    if codecs.lookup(encoding).name == "utf-8" and not any(
+        dtype.kind == "m" for dtype in df.dtypes
+    ):
+        arrow = _import_arrow_csv()
+
+    if arrow is not None:
+        pa, pacsv = arrow
+        options = pacsv.WriteOptions(include_header=False)
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowException, TypeError, ValueError):
+            table = None
+
+    n_rows = len(df)
+    for start in range(0, n_rows, chunksize):
+        end = min(start + chunksize, n_rows)
+
+        if table is not None:
+            sink = pa.BufferOutputStream()
+            try:
+                pacsv.write_csv(table.slice(start, end - start), sink, options)
+            except pa.ArrowException:
+                table = None
+            else:
+                yield end, sink.getvalue().to_pybytes()
+                continue
+
+        data = df.iloc[start:end].to_csv(index=False, header=False)
+        yield end, data.encode(encoding)
+
+
+def _binary_chunks(
+    df: pd.DataFrame,
+    chunksize: int,
+    encoding: str,
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Serialize ``df`` as binary COPY rows, ``chunksize`` rows at a time.
+
+    The payload header and trailer (``_BINARY_COPY_HEADER`` and
+    ``_BINARY_COPY_TRAILER``) are left to the caller.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Rows to serialize.
+    chunksize : int
+        Number of rows per yielded block.
+    encoding : str
+        Codec used for text values.
+
+    Yields
+    ------
+    tuple of (int, bytes)
+        Number of rows serialized so far and the encoded block.
+    """
+    row_header = struct.pack(">h", df.shape[1])
+    fixed = _binary_fixed_columns(df)
+
+    n_rows = len(df)
+    for start in range(0, n_rows, chunksize):
+        end = min(start + chunksize, n_rows)
+
+        if fixed is not None:
+            layout, columns, missing = fixed
+            if missing is None or not missing[start:end].any():
+                yield end, _binary_rows_fixed(
+                    layout, [column[start:end] for column in columns]
+                )
+                continue
+
+        chunk = df.iloc[start:end]
+        fields = [
+            _binary_fields(chunk.iloc[:, i], encoding)
+            for i in range(chunk.shape[1])
+        ]
+        yield end, b"".join(chain.from_iterable(
+            zip(repeat(row_header), *fields)
+        ))
+
+
+def _insert_copy(
+    *,
+    cur,
+    df: pd.DataFrame,
+    statement: sql.Composed,
+    chunksize: int,
+    progress_callback: Optional[Callable[[int], None]],
+):
+    """Send ``df`` with a single streamed ``COPY ... FROM STDIN``."""
+    encoding = _client_encoding(cur)
+
+    def write(f):
+        for end, data in _csv_chunks(df, chunksize, encoding):
+            f.write(data)
+
+            if progress_callback is not None:
+                progress_callback(end)
+
+    _copy_from_writer(cur=cur, statement=statement, write=write)
+
+
+def _insert_binary(
+    *,
+    cur,
+    df: pd.DataFrame,
+    statement: sql.Composed,
+    chunksize: int,
+    progress_callback: Optional[Callable[[int], None]],
+):
+    """Send ``df`` with a single streamed binary ``COPY ... FROM STDIN``."""
+    encoding = _client_encoding(cur)
+
+    def write(f):
+        f.write(_BINARY_COPY_HEADER)
+
+        for end, rows in _binary_chunks(df, chunksize, encoding):
+            f.write(rows)
+
+            if progress_callback is not None:
+                progress_callback(end)
+
+        f.write(_BINARY_COPY_TRAILER)
+
+    _copy_from_writer(cur=cur, statement=statement, write=write)
+
+
+def _insert_values(
+    *,
+    cur,
+    df: pd.DataFrame,
+    statement: sql.Composed,
+    chunksize: int,
+    progress_callback: Optional[Callable[[int], None]],
+):
+    """Send ``df`` as multi-row ``INSERT ... VALUES`` statements."""
+    # Match the COPY path, where missing values are written as NULL.
+    if df.isna().values.any():
+        df = df.astype(object).where(df.notna(), None)
+
+    n_rows = len(df)
+    for start in range(0, n_rows, chunksize):
+        end = min(start + chunksize, n_rows)
+        execute_values(
+            cur,
+            statement,
+            df.iloc[start:end].itertuples(index=False, name=None),
+            page_size=chunksize,
+        )
+
+        if progress_callback is not None:
+            progress_callback(end)
 
 
 def insert_dataframe(
@@ -9,40 +600,84 @@ def insert_dataframe(
     df: pd.DataFrame,
     table_name: str,
     schema: str,
-    chunksize: int = 5000
-):
-    """Insert a pandas DataFrame into a target database table."""
+    chunksize: int = 5000,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    method: Literal["copy", "binary", "values"] = "copy",
+    require_nonempty: bool = False,
+) -> int:
+    """
+    Insert a pandas DataFrame into a target database table.
+
+    With ``method="copy"`` the whole frame is sent with a single
+    ``COPY ... FROM STDIN``; rows are serialized ``chunksize`` at a time
+    while the server consumes them, by pyarrow's CSV writer when it is
+    installed (``nova-pg[arrow]``). ``method="binary"`` does the same with
+    PostgreSQL's binary COPY format, skipping the number-to-text-and-back
+    round trip; column dtypes must then match the target column types
+    exactly (see ``_binary_fields``). ``method="values"`` sends multi-row
+    ``INSERT ... VALUES`` statements of ``chunksize`` rows instead, for
+    targets where COPY is not usable (e.g. row-level security, triggers
+    that must see INSERTs, or drivers without COPY support).
+
+    Parameters
+    ----------
+    cur : psycopg cursor
+        Active database cursor.
+    df : pd.DataFrame
+        Rows to insert. Column names must match the target table.
+    table_name : str
+        Name of the target table.
+    schema : str
+        Schema containing the target table.
+    chunksize : int
+        Number of rows serialized per batch.
+    progress_callback : callable, optional
+        Called with the cumulative number of rows written after each batch.
+        With the COPY methods it runs on the thread serializing ``df``.
+    method : {"copy", "binary", "values"}
+        Insert strategy. Defaults to "copy".
+    require_nonempty : bool
+        Raise ``ValueError`` for an empty ``df`` instead of returning 0.
+
+    Returns
+    -------
+    int
+        Number of rows inserted.
+    """
     if df.empty:
-        raise ValueError(
-            "The provided DataFrame is empty and cannot be inserted."
-        )
-    
-    start = 0
-    end = min(start + chunksize, len(df))
-    while start < len(df):
-        chunk = df.iloc[start:end]
-        
-        buffer = io.StringIO()
-        chunk.to_csv(buffer, index=False, header=False)
-        buffer.seek(0)
+        if require_nonempty:
+            raise ValueError(
+                "The provided DataFrame is empty and cannot be inserted."
+            )
 
-        try:
-            sql = f"""
-            COPY {schema}.{table_name} ({', '.join(chunk.columns)})
-            FROM STDIN WITH CSV
-            """
-            cur.copy_expert(sql=sql, file=buffer)
+        return 0
 
-        except Exception as e:
-            raise RuntimeError(
-                f"Error inserting DataFrame into {schema}.{table_name}: {e}"
-            ) from e
+    if method == "copy":
+        insert = _insert_copy
+    elif method == "binary":
+        insert = _insert_binary
+    elif method == "values":
+        insert = _insert_values
+    else:
+        raise ValueError(f"Unsupported insert method '{method}'")
 
-        finally:
-            buffer.close()
+    try:
+        insert(
+            cur=cur,
+            df=df,
+            statement=_insert_statement(
+                method, schema, table_name, tuple(df.columns)
+            ),
+            chunksize=chunksize,
+            progress_callback=progress_callback,
+        )
 
-        start = end
-        end += chunksize
+    except Exception as e:
+        raise RuntimeError(
+            f"Error inserting DataFrame into {schema}.{table_name}: {e}"
+        ) from e
+
+    return len(df)
 
 
 def schema_exists(
@@ -58,26 +693,25 @@ def schema_exists(
     cur : psycopg cursor
         Database cursor used to execute the query.
     schema_name : str
-        Name of the schema to check. The function escapes single quotes
-        to avoid breaking the query, since execute_query does not support
-        params.
+        Name of the schema to check. It is passed as a bound parameter.
 
     Returns
     -------
     bool
         True if the schema exists, otherwise False.
     """
-    
-    safe_schema = schema_name.replace("'", "''")
-
-    query = f"""
+    query = """
     SELECT EXISTS (
         SELECT FROM pg_namespace
-        WHERE nspname = '{safe_schema}'
+        WHERE nspname = %s
     );
     """
 
-    row = nova_pg.utils.fetch_one(cur=cur, query=query)
+    _, row = nova_pg.utils.fetch_one(
+        cur=cur,
+        query=query,
+        params=(schema_name,),
+    )
 
     if row is None:
         return False
@@ -101,28 +735,28 @@ def table_exists(
     schema_name : str
         Schema where the table should exist.
     table_name : str
-        Name of the table to check. The function escapes single quotes
-        because execute_query does not support parameter binding.
+        Name of the table to check. Both names are passed as bound
+        parameters.
 
     Returns
     -------
     bool
         True if the table exists in the specified schema, otherwise False.
     """
-
-    safe_schema = schema_name.replace("'", "''")
-    safe_table_name = table_name.replace("'", "''")
-
-    query = f"""
+    query = """
     SELECT EXISTS (
         SELECT 1
         FROM information_schema.tables
-        WHERE table_schema = '{safe_schema}'
-        AND table_name = '{safe_table_name}'
+        WHERE table_schema = %s
+        AND table_name = %s
     );
     """
 
-    row = nova_pg.utils.fetch_one(cur=cur, query=query)
+    _, row = nova_pg.utils.fetch_one(
+        cur=cur,
+        query=query,
+        params=(schema_name, table_name),
+    )
 
     if row is None:
         return False
@@ -153,59 +787,55 @@ def create_table(
 
     Notes
     -----
-    - No param binding is used because execute_query does not support it.
-    - Single quotes in schema/table names are escaped manually.
+    - Schema, table and column names are quoted with ``sql.Identifier``,
+      so they are used verbatim (case-sensitive).
     - Unsupported Python types raise ValueError.
+    - Schema and table existence are checked with a single query before
+      the ``CREATE TABLE``, so the call costs two round-trips.
     """
-
-    safe_schema = schema_name.replace("'", "''")
-    safe_table_name = table_name.replace("'", "''")
-
-    pg_map = {
-        "int": "BIGINT",
-        "float": "DOUBLE PRECISION",
-        "decimal": "NUMERIC",
-        "bool": "BOOLEAN",
-        "str": "TEXT",
-        "bytes": "BYTEA",
-        "datetime": "TIMESTAMPTZ",
-        "date": "DATE",
-        "time": "TIME",
-        "timedelta": "INTERVAL",
-    }
-
+    column_defs = []
     for col, dtype in columns_map.items():
-        if dtype not in pg_map:
+        pg_type = _PG_TYPE_MAP.get(dtype)
+        if pg_type is None:
             raise ValueError(
                 f"Unsupported dtype '{dtype}' for column '{col}'"
             )
 
-    column_defs = ", ".join(
-        f"{col} {pg_map[dtype]}"
-        for col, dtype in columns_map.items()
+        column_defs.append(
+            sql.SQL("{} {}").format(sql.Identifier(col), pg_type)
+        )
+
+    query = sql.SQL("CREATE TABLE {}.{} ({});").format(
+        sql.Identifier(schema_name),
+        sql.Identifier(table_name),
+        sql.SQL(", ").join(column_defs),
     )
 
-    query = (
-        f"CREATE TABLE {safe_schema}.{safe_table_name} (\n"
-        f"    {column_defs}\n"
-        f");"
+    # One round-trip for both pre-checks. to_regclass also sees views and
+    # other relations, any of which would make CREATE TABLE fail.
+    _, row = nova_pg.utils.fetch_one(
+        cur=cur,
+        query="""
+        SELECT
+            EXISTS (SELECT FROM pg_namespace WHERE nspname = %s),
+            to_regclass(quote_ident(%s) || '.' || quote_ident(%s))
+                IS NOT NULL;
+        """,
+        params=(schema_name, schema_name, table_name),
     )
+    schema_found, table_found = row
 
-    if not schema_exists(cur=cur, schema_name=safe_schema):
-        raise ValueError(f"Schema '{safe_schema}' does not exist.")
+    if not schema_found:
+        raise ValueError(f"Schema '{schema_name}' does not exist.")
 
-    if table_exists(
-        cur=cur,
-        schema_name=safe_schema,
-        table_name=safe_table_name,
-    ):
+    if table_found:
         raise ValueError(
-            f"Table '{safe_schema}.{safe_table_name}' already exists."
+            f"Table '{schema_name}.{table_name}' already exists."
         )
 
     try:
         nova_pg.utils.execute_query(cur=cur, query=query)
     except Exception as e:
         raise RuntimeError(
-            f"Error creating table '{safe_schema}.{safe_table_name}': {e}"
-        )
+            f"Error creating table '{schema_name}.{table_name}': {e}"
+        ) from e
@@ -1,92 +1,341 @@
+from typing import (
+    Dict, Iterable, Iterator, List, Tuple, Optional, Sequence, Union
+)
+from psycopg2.extras import execute_batch, execute_values
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from contextlib import contextmanager
-from typing import List, Tuple, Optional
+from psycopg2 import sql
+import threading
 import psycopg2
+import weakref
+import atexit
+import time
+import uuid
+import os
+
+
+_POOLS: Dict[str, ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+_ROWCOUNT_TTL = 60.0
+_ROWCOUNT_CACHE: Dict[Tuple[int, Optional[str], str], Tuple[float, int]] = {}
 
 
 def connect_to_db(
     database_url: str,
+    *,
+    autocommit: bool = False,
 ) -> psycopg2.extensions.connection:
     """Open a database connection.
 
     Args:
         database_url: PostgreSQL connection string.
+        autocommit: Commit every statement on its own instead of opening a
+            transaction. Saves the BEGIN/COMMIT round-trips for one-shot
+            DDL such as ``create_schema``.
 
     Returns:
-        psycopg2 connection object with autocommit disabled.
+        psycopg2 connection object, with autocommit disabled by default.
 
     Raises:
         ConnectionError: If connection cannot be established.
     """
     try:
         conn = psycopg2.connect(database_url)
-        conn.autocommit = False
+        conn.autocommit = autocommit
         return conn
 
     except psycopg2.Error as e:
-        raise ConnectionError(f"Connection to db failed: {e}")
+        raise ConnectionError(f"Connection to db failed: {e}") from e
+
+
+def _get_pool(
+    database_url: str,
+) -> ThreadedConnectionPool:
+    """Return the connection pool for a database, creating it on first use.
+
+    The pool keeps up to ``NOVA_PG_POOL_MIN`` idle connections (default 1)
+    and opens at most ``NOVA_PG_POOL_MAX`` (default 8); connections given
+    back beyond the idle limit are closed.
+
+    Args:
+        database_url: PostgreSQL connection string.
+
+    Returns:
+        Connection pool shared by every caller using the same URL.
+
+    Raises:
+        ConnectionError: If the pool cannot open its first connection.
+    """
+    pool = _POOLS.get(database_url)
+    if pool is not None:
+        return pool
+
+    with _POOLS_LOCK:
+        pool = _POOLS.get(database_url)
+        if pool is None:
+            try:
+                pool = ThreadedConnectionPool(
+                    minconn=int(os.environ.get("NOVA_PG_POOL_MIN", "1")),
+                    maxconn=int(os.environ.get("NOVA_PG_POOL_MAX", "8")),
+                    dsn=database_url,
+                )
+            except psycopg2.Error as e:
+                raise ConnectionError(f"Connection to db failed: {e}") from e
+
+            _POOLS[database_url] = pool
+
+    return pool
+
+
+def close_all_pools() -> None:
+    """Close every pooled connection and forget the pools.
+
+    Registered with ``atexit``; call it explicitly to release server
+    sessions earlier, e.g. before forking worker processes.
+    """
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.closeall()
+
+        _POOLS.clear()
+
+
+atexit.register(close_all_pools)
+
+
+@contextmanager
+def _transaction(
+    conn: psycopg2.extensions.connection,
+    autocommit: bool = False,
+):
+    """Yield a cursor on ``conn``, committing on success and rolling back
+    on error. The cursor is closed on exit; the connection is left open.
+
+    With ``autocommit`` every statement commits on its own and there is no
+    transaction to end. The connection's setting is only changed when it
+    differs, since psycopg2 refuses to change it inside an open transaction,
+    and the caller's setting is restored on exit."""
+    restore_autocommit = conn.autocommit
+    if restore_autocommit != autocommit:
+        conn.autocommit = autocommit
+
+    cur = conn.cursor()
+
+    try:
+        yield cur
+        if not autocommit:
+            conn.commit()
+
+    except Exception:
+        if not autocommit:
+            conn.rollback()
+        raise
+
+    finally:
+        cur.close()
+
+        if restore_autocommit != autocommit and not conn.closed:
+            conn.autocommit = restore_autocommit
 
 
 @contextmanager
 def get_cursor(
-    database_url: str,
+    database_url: Optional[str] = None,
+    *,
+    conn: Optional[psycopg2.extensions.connection] = None,
+    autocommit: bool = False,
 ):
     """Context manager yielding a cursor with automatic transaction handling.
 
+    Connections are leased from a pool shared per ``database_url`` and given
+    back on exit, so consecutive blocks reuse the same server session instead
+    of reconnecting. A connection whose block raised is closed rather than
+    returned, so a broken session is never handed to the next caller.
+    The pool holds at most ``NOVA_PG_POOL_MAX`` connections (default 8);
+    blocks opened while all of them are leased, whether from other threads
+    or nested in the same one, run on a dedicated connection that is
+    closed on exit.
+
+    Passing ``conn`` instead runs the transaction on a connection the caller
+    owns (e.g. from ``connect_to_db``); it is committed or rolled back but
+    never closed. Either way, group related operations in one block rather
+    than opening a block per helper call: every block is a transaction and
+    a commit round-trip.
+
+    ``autocommit=True`` skips the transaction altogether: each statement is
+    committed as it runs and nothing is rolled back on error. Use it for
+    one-shot DDL such as ``create_schema``, where BEGIN and COMMIT would
+    only add round-trips.
+
     Args:
         database_url: PostgreSQL connection string.
+        conn: Open connection to use instead of the pool.
+        autocommit: Run the block's statements in autocommit mode.
 
     Yields:
         psycopg2 cursor.
 
     Raises:
+        ValueError: If neither ``database_url`` nor ``conn`` is given.
+        ConnectionError: If a connection cannot be obtained.
         Propagates any exception from query execution.
     """
-    conn = connect_to_db(database_url)
-    cur = conn.cursor()
+    if conn is not None:
+        with _transaction(conn, autocommit) as cur:
+            yield cur
+
+        return
+
+    if database_url is None:
+        raise ValueError("get_cursor requires database_url or conn")
+
+    pool = _get_pool(database_url)
 
     try:
-        yield cur
-        conn.commit()
+        pooled_conn = pool.getconn()
+    except PoolError:
+        # Every pooled connection is leased, e.g. by more concurrent or
+        # nested blocks than NOVA_PG_POOL_MAX.
+        pooled_conn = None
+    except psycopg2.Error as e:
+        raise ConnectionError(f"Connection to db failed: {e}") from e
 
-    except Exception:
-        conn.rollback()
-        raise
+    if pooled_conn is None:
+        own_conn = connect_to_db(database_url)
+        try:
+            with _transaction(own_conn, autocommit) as cur:
+                yield cur
+
+        finally:
+            own_conn.close()
+
+        return
+
+    discard = True
+    try:
+        with _transaction(pooled_conn, autocommit) as cur:
+            yield cur
+
+        discard = False
 
     finally:
-        cur.close()
-        conn.close()
+        pool.putconn(pooled_conn, close=discard)
 
 
 def execute_query(
     *,
     cur,
-    query: str,
+    query: Union[str, sql.Composable],
 ) -> None:
     """Execute a generic SQL statement.
 
     Args:
         cur: psycopg2 cursor.
-        query: SQL statement.
+        query: SQL statement, as a string or a ``psycopg2.sql`` composition.
 
     Raises:
-        Exception: On execution errors.
+        psycopg2.Error: On execution errors.
     """
-    try:
-        cur.execute(query)
-    except Exception as e:
-        raise Exception(f"An error occurred during query execution: {e}")
+    cur.execute(query)
+
+
+def execute_many(
+    *,
+    cur,
+    query: Union[str, sql.Composable],
+    argslist: Iterable[Sequence],
+    page_size: int = 500,
+) -> None:
+    """Execute a parameterized statement once per argument tuple.
+
+    Statements are joined ``page_size`` at a time and sent in one
+    round-trip per page, instead of one round-trip per row as with
+    ``cur.executemany``. For bulk loads prefer
+    ``toolbox.insert_dataframe``, which uses COPY.
+
+    Args:
+        cur: psycopg2 cursor.
+        query: SQL statement with ``%s`` placeholders.
+        argslist: Parameters for each execution.
+        page_size: Number of statements sent per round-trip.
+
+    Raises:
+        psycopg2.Error: On execution errors.
+    """
+    execute_batch(cur, query, argslist, page_size=page_size)
+
+
+def execute_values_many(
+    *,
+    cur,
+    query: Union[str, sql.Composable],
+    argslist: Iterable[Sequence],
+    template: Optional[str] = None,
+    page_size: int = 500,
+) -> None:
+    """Execute a statement with a single ``VALUES %s`` for many rows.
+
+    Rows are expanded ``page_size`` at a time into one multi-row
+    ``VALUES`` list, so an INSERT of N rows costs N / ``page_size``
+    statements.
+
+    Args:
+        cur: psycopg2 cursor.
+        query: SQL statement containing a single ``%s`` placeholder,
+            e.g. ``INSERT INTO t (a, b) VALUES %s``.
+        argslist: Rows to expand into the ``VALUES`` list.
+        template: Row template such as ``"(%s, %s::jsonb)"``. Defaults to
+            one ``%s`` per row item.
+        page_size: Number of rows per statement.
+
+    Raises:
+        psycopg2.Error: On execution errors.
+    """
+    execute_values(
+        cur, query, argslist, template=template, page_size=page_size
+    )
+
+
+def run(
+    *,
+    cur,
+    query: Union[str, sql.Composable],
+    params: Optional[Sequence] = None,
+) -> Tuple[List[str], psycopg2.extensions.cursor]:
+    """Execute a query once and hand back its columns and the cursor.
+
+    Callers can then fetch from the returned cursor as many times, and in
+    whatever way, they need without re-running the query.
+
+    Args:
+        cur: psycopg2 cursor.
+        query: SQL query.
+        params: Values bound to the query placeholders.
+
+    Returns:
+        Tuple of:
+            - List of column names (empty for statements without a result).
+            - The cursor, positioned before the first row.
+    """
+    cur.execute(query, params)
+    column_names = [desc[0] for desc in cur.description or ()]
+
+    return column_names, cur
 
 
 def fetch_one(
     *,
     cur,
-    query: str,
+    query: Union[str, sql.Composable],
+    params: Optional[Sequence] = None,
 ) -> Tuple[List[str], Optional[Tuple]]:
     """Execute a SELECT query and fetch the first row.
 
     Args:
         cur: psycopg2 cursor.
         query: SQL SELECT query.
+        params: Values bound to the query placeholders.
 
     Returns:
         Tuple of:
@@ -94,16 +343,10 @@ def fetch_one(
             - First row or None.
 
     Raises:
-        Exception: On execution errors.
+        psycopg2.Error: On execution errors.
     """
-    try:
-        cur.execute(query)
-        column_names = [desc[0] for desc in cur.description]
-        result = cur.fetchone()
-        return column_names, result
-
-    except Exception as e:
-        raise Exception(f"An error occurred during fetch: {e}")
+    column_names, cur = run(cur=cur, query=query, params=params)
+    return column_names, cur.fetchone()
 
 
 def fetch_many(
@@ -125,16 +368,10 @@ def fetch_many(
             - List of rows.
 
     Raises:
-        Exception: On execution errors.
+        psycopg2.Error: On execution errors.
     """
-    try:
-        cur.execute(query)
-        column_names = [desc[0] for desc in cur.description]
-        results = cur.fetchmany(batch_size)
-        return column_names, results
-
-    except Exception as e:
-        raise Exception(f"An error occurred during fetch: {e}")
+    column_names, cur = run(cur=cur, query=query)
+    return column_names, cur.fetchmany(batch_size)
 
 
 def fetch_all(
@@ -154,16 +391,264 @@ def fetch_all(
             - List of all rows.
 
     Raises:
-        Exception: On execution errors.
+        psycopg2.Error: On execution errors.
     """
+    column_names, cur = run(cur=cur, query=query)
+    return column_names, cur.fetchall()
+
+
+def _named_cursor(
+    cur,
+    batch_size: int,
+):
+    """Open a server-side cursor on the connection of ``cur``."""
+    named_cur = cur.connection.cursor(name=f"nova_chunked_{uuid.uuid4().hex}")
+    named_cur.itersize = batch_size
+    return named_cur
+
+
+def iter_rows(
+    *,
+    cur,
+    query: str,
+    batch_size: int = 1000,
+    server_side: bool = False,
+) -> Iterator[Tuple]:
+    """Execute a SELECT query and yield its rows one at a time.
+
+    Rows are converted to Python tuples ``batch_size`` at a time as the
+    caller iterates, so consumers that filter, aggregate or stop early never
+    hold the full result as Python objects. The query runs on first
+    iteration.
+
+    By default libpq still receives the whole result before the first row is
+    yielded. With ``server_side=True`` the query runs on a named cursor and
+    only ``batch_size`` rows are transferred per round-trip, keeping client
+    memory flat for results of any size; as with ``fetch_in_chunks``, the
+    rows must then be consumed inside the surrounding transaction.
+
+    Args:
+        cur: psycopg2 cursor.
+        query: SQL SELECT query.
+        batch_size: Number of rows converted per ``fetchmany`` call.
+        server_side: Stream the result from a server-side cursor.
+
+    Yields:
+        One row per iteration.
+
+    Raises:
+        psycopg2.Error: On execution or fetch errors.
+    """
+    if server_side:
+        cur = _named_cursor(cur, batch_size)
+
     try:
         cur.execute(query)
-        column_names = [desc[0] for desc in cur.description]
-        results = cur.fetchall()
-        return column_names, results
+
+        while True:
+            batch = cur.fetchmany(batch_size)
+            if not batch:
+                return
+
+            yield from batch
+
+    finally:
+        if server_side:
+            cur.close()
+
+
+def _arrow_column_types(pa, description) -> Dict:
+    """Map result columns with a well-known PostgreSQL type to Arrow types.
+
+    ``numeric(p, s)`` with ``p <= 38`` maps to an Arrow decimal of the same
+    precision and scale, and any other ``numeric`` to strings, so values
+    are never rounded through float64; a NaN in a ``numeric(p, s)`` column
+    fails to parse. Columns with other types are left to pyarrow's type
+    inference.
+    """
+    pg_to_arrow = {
+        16: pa.bool_(),
+        20: pa.int64(),
+        21: pa.int16(),
+        23: pa.int32(),
+        700: pa.float32(),
+        701: pa.float64(),
+        19: pa.string(),
+        25: pa.string(),
+        1042: pa.string(),
+        1043: pa.string(),
+        1082: pa.date32(),
+        1114: pa.timestamp("us"),
+        1184: pa.timestamp("us", tz="UTC"),
+    }
+
+    column_types = {}
+    for desc in description:
+        if desc[1] in pg_to_arrow:
+            column_types[desc[0]] = pg_to_arrow[desc[1]]
+
+        elif desc[1] == 1700:
+            # Unconstrained numeric reports a precision of 65535; the CSV
+            # reader cannot parse decimal256, so only decimal128 is used.
+            precision, scale = desc[4], desc[5]
+            if precision is None or not 0 <= scale <= precision <= 38:
+                column_types[desc[0]] = pa.string()
+            else:
+                column_types[desc[0]] = pa.decimal128(precision, scale)
+
+    return column_types
+
+
+def fetch_arrow(
+    *,
+    cur,
+    query: str,
+):
+    """Execute a SELECT query and return the result as a ``pyarrow.Table``.
+
+    The result is exported server-side with ``COPY (query) TO STDOUT`` and
+    parsed by pyarrow's multithreaded CSV reader straight into columnar
+    buffers, so no per-cell Python objects are created. Column types are
+    taken from the query description where they have a direct Arrow
+    equivalent, which costs one extra ``LIMIT 0`` round-trip. ``numeric``
+    columns come back as exact decimals, or as strings when unconstrained
+    or wider than 38 digits, never as rounded floats. The CSV text is
+    streamed through an OS pipe rather than held in memory.
+
+    Requires the optional ``pyarrow`` dependency (``nova-pg[arrow]``).
+
+    Args:
+        cur: psycopg2 cursor.
+        query: SQL SELECT query, without a trailing semicolon.
+
+    Returns:
+        pyarrow.Table with one column per result column.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        RuntimeError: On execution or parsing errors.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError as e:
+        raise ImportError(
+            "fetch_arrow requires pyarrow: pip install 'nova-pg[arrow]'"
+        ) from e
+
+    query = query.strip().rstrip(";")
+
+    try:
+        cur.execute(
+            sql.SQL("SELECT * FROM ({}) AS q LIMIT 0").format(sql.SQL(query))
+        )
+        convert_options = pacsv.ConvertOptions(
+            column_types=_arrow_column_types(pa, cur.description),
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=False,
+            true_values=["t"],
+            false_values=["f"],
+        )
+        statement = sql.SQL(
+            "COPY ({}) TO STDOUT WITH (FORMAT CSV, HEADER)"
+        ).format(sql.SQL(query))
+
+    except Exception as e:
+        raise RuntimeError(f"An error occurred during fetch: {e}") from e
+
+    r_fd, w_fd = os.pipe()
+    reader = os.fdopen(r_fd, "rb")
+    writer = os.fdopen(w_fd, "wb")
+    errors = []
+
+    def produce():
+        try:
+            cur.copy_expert(sql=statement, file=writer)
+        except BrokenPipeError:
+            # The reader failed first; its error takes precedence.
+            pass
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            try:
+                writer.close()
+            except BrokenPipeError:
+                pass
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+
+    try:
+        table = pacsv.read_csv(reader, convert_options=convert_options)
 
     except Exception as e:
-        raise Exception(f"An error occurred during fetch: {e}")
+        read_error = e
+        table = None
+
+    else:
+        read_error = None
+
+    finally:
+        reader.close()
+        thread.join()
+
+    if errors:
+        raise RuntimeError(
+            f"An error occurred during fetch: {errors[0]}"
+        ) from errors[0]
+
+    if read_error is not None:
+        raise RuntimeError(
+            f"An error occurred during fetch: {read_error}"
+        ) from read_error
+
+    return table
+
+
+def fetch_arrow_adbc(
+    *,
+    database_url: str,
+    query: str,
+):
+    """Execute a SELECT query through ADBC and return a ``pyarrow.Table``.
+
+    The ADBC PostgreSQL driver receives the result in PostgreSQL's binary
+    format and decodes it column by column in native code, so neither
+    Python objects nor CSV text are produced. It manages its own
+    connection, so the query runs outside any ``get_cursor`` transaction
+    and does not use the connection pool. ``numeric`` columns come back as
+    the driver's opaque string extension type; cast them in the query if a
+    numeric Arrow type is needed.
+
+    Requires the optional ``adbc-driver-postgresql`` dependency
+    (``nova-pg[adbc]``).
+
+    Args:
+        database_url: PostgreSQL connection string.
+        query: SQL SELECT query.
+
+    Returns:
+        pyarrow.Table with one column per result column.
+
+    Raises:
+        ImportError: If the ADBC PostgreSQL driver is not installed.
+        RuntimeError: On connection, execution or fetch errors.
+    """
+    try:
+        import adbc_driver_postgresql.dbapi as adbc
+    except ImportError as e:
+        raise ImportError(
+            "fetch_arrow_adbc requires adbc-driver-postgresql: "
+            "pip install 'nova-pg[adbc]'"
+        ) from e
+
+    try:
+        with adbc.connect(database_url) as conn, conn.cursor() as cur:
+            cur.execute(query)
+            return cur.fetch_arrow_table()
+
+    except Exception as e:
+        raise RuntimeError(f"An error occurred during fetch: {e}") from e
 
 
 def create_schema(
@@ -173,39 +658,62 @@ def create_schema(
 ) -> None:
     """Create a schema if it does not already exist.
 
+    A single statement needs no surrounding transaction, so a dedicated
+    ``get_cursor(database_url, autocommit=True)`` block saves the BEGIN and
+    COMMIT round-trips.
+
     Args:
         cur: psycopg2 cursor.
         schema_name: Schema name.
 
     Raises:
-        Exception: On execution errors.
+        RuntimeError: On execution errors.
     """
     try:
-        query = f'CREATE SCHEMA IF NOT EXISTS "{schema_name}";'
+        query = sql.SQL("CREATE SCHEMA IF NOT EXISTS {};").format(
+            sql.Identifier(schema_name)
+        )
         cur.execute(query)
 
     except Exception as e:
-        raise Exception(f"Error creating schema '{schema_name}': {e}")
+        raise RuntimeError(
+            f"Error creating schema '{schema_name}': {e}"
+        ) from e
 
 
 def estimate_table_rows(
     *,
     cur,
     table_name: str,
+    schema_name: Optional[str] = None,
 ) -> int:
     """Estimate row count of a table via pg_class.reltuples.
 
+    ``reltuples`` only changes on VACUUM/ANALYZE, so estimates are cached
+    per connection for ``_ROWCOUNT_TTL`` seconds and dropped when the
+    connection is garbage-collected.
+
     Args:
         cur: psycopg2 cursor.
         table_name: Name of the table.
+        schema_name: Schema of the table. Without it, any table called
+            ``table_name`` may match when several schemas define one.
 
     Returns:
         Estimated number of rows. Defaults to 100_000 if unavailable.
 
     Raises:
-        Exception: On execution errors.
+        psycopg2.Error: On execution errors.
     """
-    try:
+    conn = cur.connection
+    key = (id(conn), schema_name, table_name)
+    now = time.monotonic()
+
+    cached = _ROWCOUNT_CACHE.get(key)
+    if cached is not None and now - cached[0] < _ROWCOUNT_TTL:
+        return cached[1]
+
+    if schema_name is None:
         cur.execute(
             """
             SELECT reltuples::BIGINT
@@ -214,12 +722,44 @@ def estimate_table_rows(
             """,
             (table_name,),
         )
+    else:
+        cur.execute(
+            """
+            SELECT c.reltuples::BIGINT
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s
+            AND c.relname = %s;
+            """,
+            (schema_name, table_name),
+        )
 
-        row = cur.fetchone()
-        return int(row[0]) if row else 100_000
+    row = cur.fetchone()
+    estimate = int(row[0]) if row else 100_000
 
-    except Exception as e:
-        raise Exception(f"An error occurred during fetch: {e}")
+    if key not in _ROWCOUNT_CACHE:
+        weakref.finalize(conn, _ROWCOUNT_CACHE.pop, key, None)
+
+    _ROWCOUNT_CACHE[key] = (now, estimate)
+
+    return estimate
+
+
+def _iter_batches(
+    cur,
+    first_batch: List[Tuple],
+    batch_size: int,
+) -> Iterator[List[Tuple]]:
+    """Yield ``first_batch`` and then further batches until ``cur`` is
+    exhausted, closing the cursor afterwards."""
+    try:
+        batch = first_batch
+        while batch:
+            yield batch
+            batch = cur.fetchmany(batch_size)
+
+    finally:
+        cur.close()
 
 
 def fetch_in_chunks(
@@ -228,36 +768,39 @@ def fetch_in_chunks(
     query: str,
     table_name: str,
     batch_size: int = 1000,
-) -> Tuple[List[str], List[Tuple]]:
-    """Execute a SELECT query and fetch results incrementally.
+) -> Tuple[List[str], Iterator[List[Tuple]]]:
+    """Execute a SELECT query and stream results in batches.
+
+    The query runs on a server-side (named) cursor opened on the connection
+    of ``cur``, so rows are transferred ``batch_size`` at a time instead of
+    being buffered client-side in full. Named cursors only live inside a
+    transaction: consume the batches before the surrounding ``get_cursor``
+    block exits. They are not scrollable.
 
     Args:
-        cur: psycopg2 cursor (supports named cursors for large datasets).
+        cur: psycopg2 cursor whose connection runs the query.
         query: SQL SELECT query.
-        table_name: Table used for row estimation.
+        table_name: Table the query reads from.
         batch_size: Number of rows per batch.
 
     Returns:
         Tuple of:
             - List of column names.
-            - List of all fetched rows.
+            - Iterator over lists of at most ``batch_size`` rows.
 
     Raises:
-        Exception: On execution or fetch errors.
+        psycopg2.Error: On execution or fetch errors.
     """
-    try:
-        cur.execute(query)
-        column_names = [desc[0] for desc in cur.description]
-        results: List[Tuple] = []
-
-        while True:
-            batch = cur.fetchmany(batch_size)
-            if not batch:
-                break
+    named_cur = _named_cursor(cur, batch_size)
 
-            results.extend(batch)
+    try:
+        named_cur.execute(query)
+        # Named cursors only expose a description after the first fetch.
+        first_batch = named_cur.fetchmany(batch_size)
+        column_names = [desc[0] for desc in named_cur.description]
 
-        return column_names, results
+    except Exception:
+        named_cur.close()
+        raise
 
-    except Exception as e:
-        raise Exception(f"An error occurred during fetch: {e}")
+    return column_names, _iter_batches(named_cur, first_batch, batch_size)
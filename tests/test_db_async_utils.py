@@ -0,0 +1,233 @@
+from unittest.mock import AsyncMock, MagicMock
+import pandas as pd
+import asyncio
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+from psycopg import sql  # noqa: E402
+from nova_pg import async_utils  # noqa: E402
+
+
+def _async_connection():
+    """Build a mock ``psycopg.AsyncConnection`` with an async cursor."""
+    mock_conn = MagicMock()
+    mock_conn.autocommit = False
+    mock_conn.commit = AsyncMock()
+    mock_conn.rollback = AsyncMock()
+    mock_conn.close = AsyncMock()
+    mock_conn.info.encoding = "utf-8"
+
+    mock_cursor = mock_conn.cursor.return_value
+    mock_cursor.connection = mock_conn
+    mock_cursor.execute = AsyncMock()
+    mock_cursor.executemany = AsyncMock()
+    mock_cursor.fetchall = AsyncMock()
+    mock_cursor.close = AsyncMock()
+    return mock_conn
+
+
+def test_get_cursor_with_caller_connection():
+    mock_conn = _async_connection()
+
+    async def scenario():
+        async with async_utils.get_cursor(conn=mock_conn) as cur:
+            await cur.execute("SELECT 1")
+
+        with pytest.raises(Exception):
+            async with async_utils.get_cursor(conn=mock_conn):
+                raise Exception("boom")
+
+    asyncio.run(scenario())
+
+    mock_conn.commit.assert_awaited_once()
+    mock_conn.rollback.assert_awaited_once()
+    assert mock_conn.cursor.return_value.close.await_count == 2
+    mock_conn.close.assert_not_awaited()
+
+
+def test_get_cursor_autocommit_restores_connection_setting():
+    mock_conn = _async_connection()
+    mock_conn.closed = False
+    mock_conn.set_autocommit = AsyncMock()
+
+    async def scenario():
+        async with async_utils.get_cursor(
+            conn=mock_conn, autocommit=True
+        ) as cur:
+            await cur.execute("CREATE SCHEMA IF NOT EXISTS s")
+
+    asyncio.run(scenario())
+
+    assert mock_conn.set_autocommit.await_args_list == [
+        ((True,),), ((False,),)
+    ]
+    mock_conn.commit.assert_not_awaited()
+
+
+def test_fetch_all_returns_column_names():
+    mock_cursor = _async_connection().cursor.return_value
+    mock_cursor.description = [MagicMock(), MagicMock()]
+    mock_cursor.description[0].name = "id"
+    mock_cursor.description[1].name = "name"
+    mock_cursor.fetchall.return_value = [(1, "a")]
+
+    cols, rows = asyncio.run(
+        async_utils.fetch_all(cur=mock_cursor, query="SELECT id, name FROM t")
+    )
+
+    assert cols == ["id", "name"]
+    assert rows == [(1, "a")]
+    mock_cursor.execute.assert_awaited_once_with(
+        "SELECT id, name FROM t", None
+    )
+
+
+def test_execute_pipeline_collects_results_after_sync():
+    mock_conn = _async_connection()
+    cursors = []
+
+    def new_cursor():
+        cur = MagicMock()
+        cur.execute = AsyncMock()
+        cur.close = AsyncMock()
+        cur.fetchall = AsyncMock(return_value=[(2,)])
+        cur.description = [MagicMock()] if cursors else None
+        cursors.append(cur)
+        return cur
+
+    mock_conn.cursor.side_effect = new_cursor
+
+    results = asyncio.run(
+        async_utils.execute_pipeline(
+            conn=mock_conn,
+            stmts=["CREATE TABLE t (v int)", "SELECT count(*) FROM t"]
+        )
+    )
+
+    assert results == [None, [(2,)]]
+    mock_conn.pipeline.assert_called_once()
+    cursors[0].execute.assert_awaited_once_with("CREATE TABLE t (v int)")
+    cursors[1].execute.assert_awaited_once_with("SELECT count(*) FROM t")
+    assert all(cur.close.await_count == 1 for cur in cursors)
+
+
+def test_iter_rows_propagates_errors():
+    mock_cursor = _async_connection().cursor.return_value
+    original = psycopg.errors.UndefinedTable("missing table")
+    mock_cursor.execute.side_effect = original
+
+    async def scenario():
+        return [
+            row async for row in async_utils.iter_rows(
+                cur=mock_cursor, query="SELECT * FROM missing"
+            )
+        ]
+
+    with pytest.raises(psycopg.errors.UndefinedTable) as e:
+        asyncio.run(scenario())
+
+    assert e.value is original
+
+
+def test_execute_values_many_expands_pages():
+    mock_cursor = _async_connection().cursor.return_value
+
+    asyncio.run(
+        async_utils.execute_values_many(
+            cur=mock_cursor,
+            query="INSERT INTO t (a, b) VALUES %s",
+            argslist=[(1, "a"), (2, "b"), (3, "c")],
+            page_size=2
+        )
+    )
+
+    assert mock_cursor.execute.await_args_list == [
+        (("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)",
+          [1, "a", 2, "b"]),),
+        (("INSERT INTO t (a, b) VALUES (%s, %s)", [3, "c"]),),
+    ]
+
+
+def test_fetch_in_chunks_streams_from_named_cursor():
+    mock_cursor = _async_connection().cursor.return_value
+    named_cursor = mock_cursor.connection.cursor.return_value
+    named_cursor.description = [MagicMock(), MagicMock()]
+    named_cursor.description[0].name = "id"
+    named_cursor.description[1].name = "name"
+    named_cursor.fetchmany = AsyncMock(
+        side_effect=[[(1, "a"), (2, "b")], [(3, "c")], []]
+    )
+
+    async def scenario():
+        cols, batches = await async_utils.fetch_in_chunks(
+            cur=mock_cursor,
+            query="SELECT * FROM table",
+            table_name="table",
+            batch_size=2
+        )
+        return cols, [batch async for batch in batches]
+
+    cols, batches = asyncio.run(scenario())
+
+    assert cols == ["id", "name"]
+    assert batches == [[(1, "a"), (2, "b")], [(3, "c")]]
+    assert mock_cursor.connection.cursor.call_args.kwargs["name"]
+    named_cursor.close.assert_awaited_once()
+
+
+def test_insert_dataframe_streams_copy_chunks():
+    mock_cursor = _async_connection().cursor.return_value
+    mock_copy = mock_cursor.copy.return_value.__aenter__.return_value
+    mock_copy.write = AsyncMock()
+    progress = []
+
+    df = pd.DataFrame({"value": range(5)})
+
+    asyncio.run(
+        async_utils.insert_dataframe(
+            cur=mock_cursor,
+            df=df,
+            table_name="mock_prices",
+            schema="mock_schema",
+            chunksize=2,
+            progress_callback=progress.append
+        )
+    )
+
+    (statement,), _ = mock_cursor.copy.call_args
+    assert statement == sql.SQL("COPY {} FROM STDIN WITH CSV").format(
+        sql.SQL("{}.{} ({})").format(
+            sql.Identifier("mock_schema"),
+            sql.Identifier("mock_prices"),
+            sql.SQL(", ").join([sql.Identifier("value")]),
+        )
+    )
+    payload = b"".join(
+        call.args[0] for call in mock_copy.write.await_args_list
+    )
+    assert payload == b"0\n1\n2\n3\n4\n"
+    assert progress == [2, 4, 5]
+
+
+def test_insert_dataframe_wraps_errors():
+    mock_cursor = _async_connection().cursor.return_value
+    mock_cursor.executemany.side_effect = psycopg.DataError("bad value")
+
+    df = pd.DataFrame({"price": [1.0, None]})
+
+    with pytest.raises(RuntimeError) as e:
+        asyncio.run(
+            async_utils.insert_dataframe(
+                cur=mock_cursor,
+                df=df,
+                table_name="mock_prices",
+                schema="mock_schema",
+                method="values"
+            )
+        )
+
+    assert "Error inserting DataFrame into mock_schema.mock_prices" in str(
+        e.value
+    )
+    assert isinstance(e.value.__cause__, psycopg.DataError)
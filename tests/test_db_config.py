@@ -2,6 +2,7 @@ from nova_pg import config
 from pathlib import Path
 import pytest
 import json
+import os
 
 
 @pytest.fixture
@@ -83,21 +84,53 @@ def test_valid_config_loads_correctly(valid_config):
     }
 
 
+def test_repeated_load_returns_cached_config(valid_config):
+    """Loading the same file and environment twice should reuse the parsed
+    configuration instead of reading the file again.
+    """
+    first = config.load_db_config(config_file_path=valid_config, env_name="dev")
+    second = config.load_db_config(config_file_path=valid_config, env_name="dev")
+
+    assert first is second
+
+
+def test_config_reloaded_after_file_change(valid_config):
+    """Should pick up changes once the file's modification time changes"""
+    config.load_db_config(config_file_path=valid_config, env_name="dev")
+
+    data = json.loads(valid_config.read_text())
+    data["dev"]["host"] = "db.internal"
+    valid_config.write_text(json.dumps(data))
+    st = valid_config.stat()
+    os.utime(valid_config, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    result = config.load_db_config(config_file_path=valid_config, env_name="dev")
+    assert result["host"] == "db.internal"
+
+
+def test_loaded_config_is_read_only(valid_config):
+    """The cached configuration must not be mutable by callers"""
+    result = config.load_db_config(config_file_path=valid_config, env_name="dev")
+
+    with pytest.raises(TypeError):
+        result["host"] = "elsewhere"
+
+
 def test_missing_file_raises_error():
     """Should raise error when file does not exist"""
     fake_path = Path("non_existent_config.json")
-    with pytest.raises(Exception):
+    with pytest.raises(FileNotFoundError):
         config.load_db_config(config_file_path=fake_path, env_name="dev")
 
 
 def test_invalid_env_raises_exception(valid_config):
     """Should raise KeyError when env not found"""
-    with pytest.raises(Exception):
+    with pytest.raises(KeyError):
         config.load_db_config(config_file_path=valid_config, env_name="prod")
 
 
 def test_missing_keys_raises_exception(tmp_path):
-    """Should raise KeyError if required keys are missing"""
+    """Should raise ValueError if required keys are missing"""
     bad_data = {
         "dev": {
             "host": "localhost",
@@ -107,7 +140,7 @@ def test_missing_keys_raises_exception(tmp_path):
     bad_file = tmp_path / "config.json"
     bad_file.write_text(json.dumps(bad_data))
 
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(ValueError) as exc:
         config.load_db_config(config_file_path=bad_file, env_name="dev")
 
     assert "Missing required keys" in str(exc.value)
@@ -118,7 +151,7 @@ def test_invalid_json_format(tmp_path):
     bad_file = tmp_path / "config.json"
     bad_file.write_text("{invalid_json: true,}")  # broken JSON
 
-    with pytest.raises(Exception):
+    with pytest.raises(ValueError):
         config.load_db_config(config_file_path=bad_file, env_name="dev")
         
     
@@ -134,6 +167,21 @@ def test_missing_keys_raises_exception_build_string():
         config.build_connection_string(bad_data)
 
 
+def test_missing_keys_build_string_lists_missing_keys():
+    """`build_connection_string` should raise ValueError naming the missing
+    keys when called with incomplete credentials.
+    """
+    bad_data = {
+        "host": "localhost",
+        "port": 5432
+    }
+    with pytest.raises(ValueError) as exc:
+        config.build_connection_string(db_cred_dict=bad_data)
+
+    assert "Missing required keys" in str(exc.value)
+    assert "password" in str(exc.value)
+
+
 def test_valid_connection_string_format():
     """Given proper database credentials, check that the connection string 
     is correctly formatted.
@@ -158,4 +206,30 @@ def test_valid_connection_string_format():
     )
 
     assert connection_string == expected_string
-    
\ No newline at end of file
+
+
+def test_connection_string_cache_can_be_cleared():
+    """Repeated builds should be served from the cache, and `cache_clear`
+    should drop the cached credentials.
+    """
+    proper_config_data = {
+        "host": "localhost",
+        "port": 5432,
+        "dbname": "test_db",
+        "user": "postgres",
+        "password": "secret",
+        "sslmode": "require",
+        "channel_binding": "require"
+    }
+
+    config.build_connection_string.cache_clear()
+    config.build_connection_string(db_cred_dict=proper_config_data)
+    config.build_connection_string(db_cred_dict=proper_config_data)
+
+    info = config._build_connection_string_cached.cache_info()
+    assert info.hits == 1
+    assert info.currsize == 1
+
+    config.build_connection_string.cache_clear()
+
+    assert config._build_connection_string_cached.cache_info().currsize == 0
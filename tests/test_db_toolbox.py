@@ -1,10 +1,22 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+from psycopg2 import sql
 from nova_pg import toolbox
 import pandas as pd
+import subprocess
+import psycopg2
+import threading
+import os
+import struct
 import pytest
+import sys
 
-def test_insert_dataframe_success():
+@patch("nova_pg.toolbox._import_arrow_csv", return_value=None)
+def test_insert_dataframe_success(_):
     mock_cursor = MagicMock()
+    payloads = []
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: payloads.append(file.read())
+    )
 
     df = pd.DataFrame(
         {
@@ -24,15 +36,85 @@ def test_insert_dataframe_success():
 
     _, kwargs = mock_cursor.copy_expert.call_args
     sql_arg = kwargs["sql"]
-    file_arg = kwargs["file"]
 
-    assert "COPY mock_schema.mock_prices" in sql_arg
-    assert "ticker" in sql_arg
-    assert "price" in sql_arg
-    assert "FROM STDIN WITH CSV" in sql_arg
+    assert sql_arg == sql.SQL("COPY {}.{} ({}) FROM STDIN WITH CSV").format(
+        sql.Identifier("mock_schema"),
+        sql.Identifier("mock_prices"),
+        sql.SQL(", ").join(
+            [sql.Identifier("ticker"), sql.Identifier("price")]
+        ),
+    )
+
+    assert payloads == [b"AAPL,350\nTSLA,400\nUSO,25\n"]
+
+
+def test_insert_dataframe_serializes_with_arrow():
+    pytest.importorskip("pyarrow")
+    mock_cursor = MagicMock()
+    mock_cursor.connection.encoding = "UTF8"
+    payloads = []
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: payloads.append(file.read())
+    )
+
+    df = pd.DataFrame(
+        {
+            "ticker": ["AAPL", "", None],
+            "price": [350.5, None, 25.0]
+        }
+    )
+
+    toolbox.insert_dataframe(
+        cur=mock_cursor,
+        df=df,
+        table_name="mock_prices",
+        schema="mock_schema",
+        chunksize=2
+    )
+
+    assert payloads == [b'"AAPL",350.5\n"",\n,25\n']
+
+
+def test_insert_dataframe_arrow_falls_back_to_pandas():
+    pytest.importorskip("pyarrow")
+    mock_cursor = MagicMock()
+    mock_cursor.connection.encoding = "UTF8"
+    payloads = []
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: payloads.append(file.read())
+    )
+
+    df = pd.DataFrame({"value": ["a", 1]})
 
-    import io
-    assert isinstance(file_arg, io.StringIO)
+    toolbox.insert_dataframe(
+        cur=mock_cursor,
+        df=df,
+        table_name="mock_prices",
+        schema="mock_schema"
+    )
+
+    assert payloads == [b"a\n1\n"]
+
+
+def test_insert_dataframe_timedelta_columns_skip_arrow():
+    pytest.importorskip("pyarrow")
+    mock_cursor = MagicMock()
+    mock_cursor.connection.encoding = "UTF8"
+    payloads = []
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: payloads.append(file.read())
+    )
+
+    df = pd.DataFrame({"elapsed": pd.to_timedelta(["1ms", "90s"])})
+
+    toolbox.insert_dataframe(
+        cur=mock_cursor,
+        df=df,
+        table_name="mock_prices",
+        schema="mock_schema"
+    )
+
+    assert payloads == [b"0 days 00:00:00.001000\n0 days 00:01:30\n"]
 
 
 def test_insert_dataframe_failure():
@@ -58,6 +140,351 @@ def test_insert_dataframe_failure():
     assert "Error inserting DataFrame" in str(e.value)
 
 
+def test_insert_dataframe_failure_with_unread_payload():
+    """A COPY that fails before draining the pipe must not leave the
+    serializing thread blocked."""
+    mock_cursor = MagicMock()
+    mock_cursor.copy_expert.side_effect = Exception("db copy error")
+
+    df = pd.DataFrame({"value": range(200_000)})
+
+    with pytest.raises(RuntimeError):
+        toolbox.insert_dataframe(
+            cur=mock_cursor,
+            df=df,
+            table_name="prices",
+            schema="mock_schema",
+            chunksize=len(df)
+        )
+
+
+def test_stalled_copy_does_not_block_other_inserts():
+    """Writers blocked on a COPY that is not reading (e.g. waiting on a
+    table lock) must not delay inserts into other tables."""
+    release = threading.Event()
+    stalled = MagicMock()
+    stalled.copy_expert.side_effect = (
+        lambda sql, file, size: release.wait(10) and file.read()
+    )
+    blocked = [
+        threading.Thread(
+            target=toolbox.insert_dataframe,
+            kwargs=dict(
+                cur=stalled,
+                df=pd.DataFrame({"value": range(100_000)}),
+                table_name="locked",
+                schema="mock_schema"
+            )
+        )
+        for _ in range(os.cpu_count() or 1)
+    ]
+
+    other = MagicMock()
+    other.copy_expert.side_effect = lambda sql, file, size: file.read()
+    inserted = []
+
+    try:
+        for thread in blocked:
+            thread.start()
+
+        thread = threading.Thread(
+            target=lambda: inserted.append(toolbox.insert_dataframe(
+                cur=other,
+                df=pd.DataFrame({"value": [1]}),
+                table_name="other",
+                schema="mock_schema"
+            ))
+        )
+        thread.start()
+        thread.join(5)
+
+        assert inserted == [1]
+
+    finally:
+        release.set()
+        for thread in blocked:
+            thread.join()
+
+
+def test_insert_dataframe_single_copy_with_progress():
+    mock_cursor = MagicMock()
+    payloads = []
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: payloads.append(file.read())
+    )
+    progress = []
+
+    df = pd.DataFrame({"value": range(5)})
+
+    inserted = toolbox.insert_dataframe(
+        cur=mock_cursor,
+        df=df,
+        table_name="mock_prices",
+        schema="mock_schema",
+        chunksize=2,
+        progress_callback=progress.append
+    )
+
+    assert inserted == 5
+    mock_cursor.copy_expert.assert_called_once()
+    assert payloads == [b"0\n1\n2\n3\n4\n"]
+    assert progress == [2, 4, 5]
+
+
+def test_insert_dataframe_binary_method():
+    mock_cursor = MagicMock()
+    payloads = []
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: payloads.append(file.read())
+    )
+
+    df = pd.DataFrame(
+        {
+            "ticker": ["AAPL", None],
+            "price": [350.5, float("nan")]
+        }
+    )
+
+    toolbox.insert_dataframe(
+        cur=mock_cursor,
+        df=df,
+        table_name="mock_prices",
+        schema="mock_schema",
+        method="binary"
+    )
+
+    _, kwargs = mock_cursor.copy_expert.call_args
+    assert kwargs["sql"] == sql.SQL(
+        "COPY {}.{} ({}) FROM STDIN WITH (FORMAT BINARY)"
+    ).format(
+        sql.Identifier("mock_schema"),
+        sql.Identifier("mock_prices"),
+        sql.SQL(", ").join(
+            [sql.Identifier("ticker"), sql.Identifier("price")]
+        ),
+    )
+
+    null = b"\xff\xff\xff\xff"
+    assert payloads == [
+        b"PGCOPY\n\xff\r\n\x00" + bytes(8)
+        + b"\x00\x02" + b"\x00\x00\x00\x04AAPL"
+        + b"\x00\x00\x00\x08" + struct.pack(">d", 350.5)
+        + b"\x00\x02" + null + null
+        + b"\xff\xff"
+    ]
+
+
+def test_insert_dataframe_binary_fixed_width_columns():
+    mock_cursor = MagicMock()
+    payloads = []
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: payloads.append(file.read())
+    )
+
+    df = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "price": [350.5, 25.0],
+            "ts": pd.to_datetime(["2000-01-01", "2000-01-02"])
+        }
+    )
+
+    toolbox.insert_dataframe(
+        cur=mock_cursor,
+        df=df,
+        table_name="mock_prices",
+        schema="mock_schema",
+        method="binary"
+    )
+
+    def row(id_, price, micros):
+        return struct.pack(">hiqidiq", 3, 8, id_, 8, price, 8, micros)
+
+    assert payloads == [
+        b"PGCOPY\n\xff\r\n\x00" + bytes(8)
+        + row(1, 350.5, 0)
+        + row(2, 25.0, 86_400_000_000)
+        + b"\xff\xff"
+    ]
+
+
+def test_insert_dataframe_binary_missing_values_in_one_chunk():
+    mock_cursor = MagicMock()
+    payloads = []
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: payloads.append(file.read())
+    )
+
+    df = pd.DataFrame({"price": [350.5, float("nan"), 25.0]})
+
+    toolbox.insert_dataframe(
+        cur=mock_cursor,
+        df=df,
+        table_name="mock_prices",
+        schema="mock_schema",
+        chunksize=1,
+        method="binary"
+    )
+
+    def row(price):
+        return struct.pack(">hid", 1, 8, price)
+
+    assert payloads == [
+        b"PGCOPY\n\xff\r\n\x00" + bytes(8)
+        + row(350.5)
+        + b"\x00\x01\xff\xff\xff\xff"
+        + row(25.0)
+        + b"\xff\xff"
+    ]
+
+
+def test_insert_dataframe_failure_midway_aborts_copy():
+    mock_cursor = MagicMock()
+    received, aborted = [], []
+
+    def copy_expert(sql, file, size):
+        # Like psycopg2: a failing read() ends the COPY with CopyFail
+        # instead of committing what was received.
+        try:
+            while file.read(size):
+                received.append(True)
+        except Exception as e:
+            aborted.append(e)
+            raise psycopg2.errors.QueryCanceled(
+                f"COPY from stdin failed: {e}"
+            )
+
+    mock_cursor.copy_expert.side_effect = copy_expert
+
+    values = [str(i) for i in range(16)]
+    values[11] = 11
+
+    with pytest.raises(RuntimeError) as e:
+        toolbox.insert_dataframe(
+            cur=mock_cursor,
+            df=pd.DataFrame({"ticker": values}),
+            table_name="mock_prices",
+            schema="mock_schema",
+            chunksize=5,
+            method="binary"
+        )
+
+    assert received
+    assert isinstance(e.value.__cause__, TypeError)
+    assert aborted == [e.value.__cause__]
+
+
+def test_insert_dataframe_binary_string_dtype():
+    mock_cursor = MagicMock()
+    payloads = []
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: payloads.append(file.read())
+    )
+
+    df = pd.DataFrame({"ticker": pd.Series(["AAPL", None], dtype="string")})
+
+    toolbox.insert_dataframe(
+        cur=mock_cursor,
+        df=df,
+        table_name="mock_prices",
+        schema="mock_schema",
+        method="binary"
+    )
+
+    assert payloads == [
+        b"PGCOPY\n\xff\r\n\x00" + bytes(8)
+        + b"\x00\x01" + b"\x00\x00\x00\x04AAPL"
+        + b"\x00\x01" + b"\xff\xff\xff\xff"
+        + b"\xff\xff"
+    ]
+
+
+def test_insert_dataframe_binary_rejects_non_str_objects():
+    mock_cursor = MagicMock()
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: file.read()
+    )
+
+    df = pd.DataFrame({"payload": [{"a": 1}]})
+
+    with pytest.raises(RuntimeError, match="binary COPY"):
+        toolbox.insert_dataframe(
+            cur=mock_cursor,
+            df=df,
+            table_name="mock_prices",
+            schema="mock_schema",
+            method="binary"
+        )
+
+
+@patch("nova_pg.toolbox.execute_values")
+def test_insert_dataframe_values_method(mock_execute_values):
+    mock_cursor = MagicMock()
+
+    df = pd.DataFrame(
+        {
+            "ticker": ["AAPL", "TSLA", None],
+            "price": [350.0, None, 25.0]
+        }
+    )
+
+    toolbox.insert_dataframe(
+        cur=mock_cursor,
+        df=df,
+        table_name="mock_prices",
+        schema="mock_schema",
+        method="values"
+    )
+
+    mock_cursor.copy_expert.assert_not_called()
+    mock_execute_values.assert_called_once()
+
+    args, kwargs = mock_execute_values.call_args
+    assert args[0] is mock_cursor
+    assert "INSERT INTO" in repr(args[1])
+    assert list(args[2]) == [
+        ("AAPL", 350.0),
+        ("TSLA", None),
+        (None, 25.0),
+    ]
+    assert kwargs["page_size"] == 5000
+
+
+def test_insert_statement_is_cached_per_column_layout():
+    df = pd.DataFrame({"ticker": ["AAPL"], "price": [350]})
+    mock_cursor = MagicMock()
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file, size: file.read()
+    )
+
+    for _ in range(2):
+        toolbox.insert_dataframe(
+            cur=mock_cursor,
+            df=df,
+            table_name="cached_prices",
+            schema="mock_schema"
+        )
+
+    first, second = mock_cursor.copy_expert.call_args_list
+    assert first.kwargs["sql"] is second.kwargs["sql"]
+
+
+def test_insert_dataframe_unknown_method():
+    mock_cursor = MagicMock()
+    df = pd.DataFrame({"price": [1]})
+
+    with pytest.raises(ValueError) as e:
+        toolbox.insert_dataframe(
+            cur=mock_cursor,
+            df=df,
+            table_name="mock_prices",
+            schema="mock_schema",
+            method="merge"
+        )
+
+    assert "Unsupported insert method" in str(e.value)
+
+
 def test_insert_empty_dataframe():
     mock_cursor = MagicMock()
     df = pd.DataFrame()
@@ -67,7 +494,117 @@ def test_insert_empty_dataframe():
             cur=mock_cursor,
             df=df,
             table_name="mock_prices",
-            schema="mock_schema"
+            schema="mock_schema",
+            require_nonempty=True
         )
 
     assert "empty" in str(e.value).lower()
+
+
+def test_insert_empty_dataframe_is_a_no_op():
+    mock_cursor = MagicMock()
+
+    inserted = toolbox.insert_dataframe(
+        cur=mock_cursor,
+        df=pd.DataFrame(),
+        table_name="mock_prices",
+        schema="mock_schema"
+    )
+
+    assert inserted == 0
+    mock_cursor.copy_expert.assert_not_called()
+
+
+def test_schema_exists_binds_schema_name():
+    mock_cursor = MagicMock()
+    mock_cursor.fetchone.return_value = (False,)
+
+    result = toolbox.schema_exists(cur=mock_cursor, schema_name="o'brien")
+
+    assert result is False
+    _, params = mock_cursor.execute.call_args[0]
+    assert params == ("o'brien",)
+
+
+def test_table_exists_binds_names():
+    mock_cursor = MagicMock()
+    mock_cursor.fetchone.return_value = (True,)
+
+    result = toolbox.table_exists(
+        cur=mock_cursor,
+        schema_name="mock_schema",
+        table_name="mock_prices"
+    )
+
+    assert result is True
+    _, params = mock_cursor.execute.call_args[0]
+    assert params == ("mock_schema", "mock_prices")
+
+
+def test_create_table_rejects_unsupported_dtype():
+    mock_cursor = MagicMock()
+
+    with pytest.raises(ValueError) as e:
+        toolbox.create_table(
+            cur=mock_cursor,
+            schema_name="mock_schema",
+            table_name="mock_prices",
+            columns_map={"ticker": "str", "payload": "json"}
+        )
+
+    assert "Unsupported dtype 'json' for column 'payload'" in str(e.value)
+    mock_cursor.execute.assert_not_called()
+
+
+def test_create_table_checks_schema_and_table_in_one_query():
+    mock_cursor = MagicMock()
+    mock_cursor.fetchone.return_value = (True, False)
+
+    toolbox.create_table(
+        cur=mock_cursor,
+        schema_name="mock_schema",
+        table_name="mock_prices",
+        columns_map={"ticker": "str", "price": "float"}
+    )
+
+    assert mock_cursor.execute.call_count == 2
+    check_query, params = mock_cursor.execute.call_args_list[0][0]
+    assert params == ("mock_schema", "mock_schema", "mock_prices")
+    assert "CREATE TABLE" in repr(mock_cursor.execute.call_args_list[1][0][0])
+
+
+@pytest.mark.parametrize(
+    "existence, message",
+    [
+        ((False, False), "does not exist"),
+        ((True, True), "already exists"),
+    ],
+)
+def test_create_table_existence_errors(existence, message):
+    mock_cursor = MagicMock()
+    mock_cursor.fetchone.return_value = existence
+
+    with pytest.raises(ValueError) as e:
+        toolbox.create_table(
+            cur=mock_cursor,
+            schema_name="mock_schema",
+            table_name="mock_prices",
+            columns_map={"ticker": "str"}
+        )
+
+    assert message in str(e.value)
+    assert mock_cursor.execute.call_count == 1
+
+
+def test_import_does_not_load_pandas():
+    """Importing the package, or toolbox itself, should not import pandas;
+    only the DataFrame passed by the caller needs it.
+    """
+    code = (
+        "import sys, nova_pg, nova_pg.toolbox; "
+        "sys.exit('pandas' in sys.modules)"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code])
+
+    assert result.returncode == 0
@@ -1,8 +1,28 @@
 from unittest.mock import patch, MagicMock
+from decimal import Decimal
+from psycopg2 import sql
 from nova_pg import utils
+import psycopg2
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def reset_pools():
+    """Drop pools created by a test so mocks do not leak between tests."""
+    yield
+    utils.close_all_pools()
+
+
+def _idle_connection():
+    """Build a mock connection that the pool considers open and idle."""
+    mock_conn = MagicMock()
+    mock_conn.closed = 0
+    mock_conn.info.transaction_status = (
+        psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    )
+    return mock_conn
+
+
 @patch("psycopg2.connect")
 def test_connect_to_db(mock_connect):
     mock_conn = MagicMock()
@@ -14,10 +34,13 @@ def test_connect_to_db(mock_connect):
     assert conn == mock_conn
     assert conn.autocommit is False
 
+    conn = utils.connect_to_db("fake_url", autocommit=True)
+    assert conn.autocommit is True
+
 
 @patch("psycopg2.connect")
 def test_get_cursor_success(mock_connect):
-    mock_conn = MagicMock()
+    mock_conn = _idle_connection()
     mock_cursor = MagicMock()
     mock_connect.return_value = mock_conn
     mock_conn.cursor.return_value = mock_cursor
@@ -25,16 +48,32 @@ def test_get_cursor_success(mock_connect):
     with utils.get_cursor("fake_url") as cur:
         cur.execute("SELECT 1")
 
+    mock_connect.assert_called_once_with(dsn="fake_url")
     mock_conn.cursor.assert_called_once()
     mock_cursor.execute.assert_called_once_with("SELECT 1")
     mock_conn.commit.assert_called_once()
     mock_cursor.close.assert_called_once()
-    mock_conn.close.assert_called_once()
+    mock_conn.close.assert_not_called()
+
+
+@patch("psycopg2.connect")
+def test_get_cursor_reuses_pooled_connection(mock_connect):
+    mock_conn = _idle_connection()
+    mock_connect.return_value = mock_conn
+
+    with utils.get_cursor("fake_url") as cur:
+        cur.execute("SELECT 1")
+
+    with utils.get_cursor("fake_url") as cur:
+        cur.execute("SELECT 2")
+
+    mock_connect.assert_called_once()
+    assert mock_conn.commit.call_count == 2
 
 
 @patch("psycopg2.connect")
 def test_get_cursor_exception_triggers_rollback(mock_connect):
-    mock_conn = MagicMock()
+    mock_conn = _idle_connection()
     mock_cursor = MagicMock()
     mock_connect.return_value = mock_conn
     mock_conn.cursor.return_value = mock_cursor
@@ -48,6 +87,190 @@ def test_get_cursor_exception_triggers_rollback(mock_connect):
     mock_conn.close.assert_called_once()
 
 
+@patch("psycopg2.connect")
+def test_get_cursor_replaces_connection_after_error(mock_connect):
+    broken, fresh = _idle_connection(), _idle_connection()
+    mock_connect.side_effect = [broken, fresh]
+
+    with pytest.raises(Exception):
+        with utils.get_cursor("fake_url"):
+            raise Exception("boom")
+
+    with utils.get_cursor("fake_url") as cur:
+        assert cur is fresh.cursor.return_value
+
+    assert mock_connect.call_count == 2
+
+
+@patch.dict("os.environ", {"NOVA_PG_POOL_MIN": "2", "NOVA_PG_POOL_MAX": "4"})
+@patch("psycopg2.connect")
+def test_pool_size_from_environment(mock_connect):
+    mock_connect.side_effect = lambda **kwargs: _idle_connection()
+
+    with utils.get_cursor("fake_url"):
+        pass
+
+    pool = utils._POOLS["fake_url"]
+    assert (pool.minconn, pool.maxconn) == (2, 4)
+
+
+@patch.dict("os.environ", {"NOVA_PG_POOL_MAX": "1"})
+@patch("psycopg2.connect")
+def test_get_cursor_exhausted_pool_uses_dedicated_connection(mock_connect):
+    pooled, extra = _idle_connection(), _idle_connection()
+    mock_connect.side_effect = [pooled, extra]
+
+    with utils.get_cursor("fake_url") as outer:
+        with utils.get_cursor("fake_url") as inner:
+            assert inner is extra.cursor.return_value
+
+        assert outer is pooled.cursor.return_value
+
+    extra.commit.assert_called_once()
+    extra.close.assert_called_once()
+    pooled.close.assert_not_called()
+
+    with utils.get_cursor("fake_url") as cur:
+        assert cur is pooled.cursor.return_value
+
+
+@patch("psycopg2.connect")
+def test_close_all_pools(mock_connect):
+    mock_conn = _idle_connection()
+    mock_connect.return_value = mock_conn
+
+    with utils.get_cursor("fake_url"):
+        pass
+
+    utils.close_all_pools()
+
+    mock_conn.close.assert_called_once()
+    assert utils._POOLS == {}
+
+
+@patch("psycopg2.connect")
+def test_get_cursor_with_caller_connection(mock_connect):
+    mock_conn = MagicMock()
+    mock_cursor = mock_conn.cursor.return_value
+
+    with utils.get_cursor(conn=mock_conn) as cur:
+        cur.execute("SELECT 1")
+
+    with pytest.raises(Exception):
+        with utils.get_cursor(conn=mock_conn):
+            raise Exception("boom")
+
+    mock_connect.assert_not_called()
+    mock_conn.commit.assert_called_once()
+    mock_conn.rollback.assert_called_once()
+    assert mock_cursor.close.call_count == 2
+    mock_conn.close.assert_not_called()
+
+
+class _StrictConnection:
+    """Connection stand-in that, like psycopg2, rejects autocommit changes
+    while a transaction is open."""
+
+    closed = 0
+
+    def __init__(self, autocommit=False):
+        self._autocommit = autocommit
+        self.in_transaction = False
+
+    def cursor(self):
+        cur = MagicMock()
+        cur.execute.side_effect = self._begin
+        return cur
+
+    def _begin(self, *args):
+        if not self._autocommit:
+            self.in_transaction = True
+
+    def commit(self):
+        self.in_transaction = False
+
+    rollback = commit
+
+    @property
+    def autocommit(self):
+        return self._autocommit
+
+    @autocommit.setter
+    def autocommit(self, value):
+        if self.in_transaction:
+            raise psycopg2.ProgrammingError(
+                "set_session cannot be used inside a transaction"
+            )
+        self._autocommit = value
+
+
+def test_get_cursor_inside_open_transaction():
+    conn = _StrictConnection()
+    conn.cursor().execute("SELECT 1")
+    assert conn.in_transaction
+
+    with utils.get_cursor(conn=conn) as cur:
+        with utils.get_cursor(conn=conn) as nested:
+            nested.execute("SELECT 2")
+        cur.execute("SELECT 3")
+
+    assert conn.autocommit is False
+
+
+def test_get_cursor_restores_caller_autocommit():
+    conn = _StrictConnection(autocommit=True)
+
+    with utils.get_cursor(conn=conn) as cur:
+        cur.execute("SELECT 1")
+        assert conn.autocommit is False
+
+    assert conn.autocommit is True
+
+
+@patch("psycopg2.connect")
+def test_get_cursor_autocommit_skips_transaction(mock_connect):
+    mock_conn = _idle_connection()
+    mock_conn.autocommit = False
+    mock_connect.return_value = mock_conn
+
+    with utils.get_cursor("fake_url", autocommit=True) as cur:
+        assert mock_conn.autocommit is True
+        cur.execute("CREATE SCHEMA IF NOT EXISTS s")
+
+    mock_conn.commit.assert_not_called()
+    assert mock_conn.autocommit is False
+
+    with utils.get_cursor("fake_url") as cur:
+        cur.execute("SELECT 1")
+
+    mock_conn.commit.assert_called_once()
+
+
+def test_get_cursor_autocommit_on_caller_connection():
+    conn = _StrictConnection()
+
+    with utils.get_cursor(conn=conn, autocommit=True) as cur:
+        cur.execute("CREATE SCHEMA IF NOT EXISTS s")
+        assert not conn.in_transaction
+
+    assert conn.autocommit is False
+
+
+def test_get_cursor_requires_url_or_connection():
+    with pytest.raises(ValueError):
+        with utils.get_cursor():
+            pass
+
+
+@patch("psycopg2.connect")
+def test_get_cursor_connection_failure(mock_connect):
+    mock_connect.side_effect = psycopg2.OperationalError("unreachable")
+
+    with pytest.raises(ConnectionError):
+        with utils.get_cursor("fake_url"):
+            pass
+
+
 def test_execute_query_success():
     mock_cursor = MagicMock()
     utils.execute_query(cur=mock_cursor, query="SELECT 1",)
@@ -56,12 +279,75 @@ def test_execute_query_success():
 
 def test_execute_query_failure():
     mock_cursor = MagicMock()
-    mock_cursor.execute.side_effect = Exception("sql error")
+    original = psycopg2.ProgrammingError("sql error")
+    mock_cursor.execute.side_effect = original
 
-    with pytest.raises(Exception) as e:
+    with pytest.raises(psycopg2.ProgrammingError) as e:
         utils.execute_query(cur=mock_cursor, query="SELECT 1")
 
-    assert "An error occurred during query execution" in str(e.value)
+    assert e.value is original
+
+
+@patch("nova_pg.utils.execute_batch")
+def test_execute_many_pages_statements(mock_execute_batch):
+    mock_cursor = MagicMock()
+    argslist = [(1, "a"), (2, "b")]
+
+    utils.execute_many(
+        cur=mock_cursor,
+        query="UPDATE t SET v = %s WHERE k = %s",
+        argslist=argslist,
+        page_size=100
+    )
+
+    mock_execute_batch.assert_called_once_with(
+        mock_cursor,
+        "UPDATE t SET v = %s WHERE k = %s",
+        argslist,
+        page_size=100
+    )
+
+
+@patch("nova_pg.utils.execute_values")
+def test_execute_values_many_propagates_errors(mock_execute_values):
+    mock_cursor = MagicMock()
+    mock_execute_values.side_effect = psycopg2.DataError("bad value")
+
+    with pytest.raises(psycopg2.DataError):
+        utils.execute_values_many(
+            cur=mock_cursor,
+            query="INSERT INTO t (a) VALUES %s",
+            argslist=[(1,)]
+        )
+
+    _, kwargs = mock_execute_values.call_args
+    assert kwargs == {"template": None, "page_size": 500}
+
+
+def test_run_executes_once_and_returns_cursor():
+    mock_cursor = MagicMock()
+    mock_cursor.description = [("id",), ("name",)]
+
+    cols, cur = utils.run(
+        cur=mock_cursor,
+        query="SELECT id, name FROM table WHERE id = %s",
+        params=(1,)
+    )
+
+    assert cols == ["id", "name"]
+    assert cur is mock_cursor
+    mock_cursor.execute.assert_called_once_with(
+        "SELECT id, name FROM table WHERE id = %s", (1,)
+    )
+
+
+def test_run_statement_without_result():
+    mock_cursor = MagicMock()
+    mock_cursor.description = None
+
+    cols, _ = utils.run(cur=mock_cursor, query="UPDATE table SET x = 1")
+
+    assert cols == []
 
 
 def test_fetch_all_success():
@@ -73,22 +359,76 @@ def test_fetch_all_success():
         query="SELECT * FROM table"
     )
 
-    mock_cursor.execute.assert_called_once_with("SELECT * FROM table")
+    mock_cursor.execute.assert_called_once_with("SELECT * FROM table", None)
     mock_cursor.fetchall.assert_called_once()
     assert result == [("row1",), ("row2",)]
 
 
 def test_fetch_all_failure():
     mock_cursor = MagicMock()
-    mock_cursor.execute.side_effect = Exception("db error")
+    mock_cursor.execute.side_effect = psycopg2.OperationalError("db error")
 
-    with pytest.raises(Exception) as e:
+    with pytest.raises(psycopg2.OperationalError) as e:
         utils.fetch_all(
             cur=mock_cursor,
             query="SELECT * FROM table"
         )
 
-    assert "An error occurred during fetch" in str(e.value)
+    assert str(e.value) == "db error"
+
+
+def test_iter_rows_yields_lazily():
+    mock_cursor = MagicMock()
+    mock_cursor.fetchmany.side_effect = [[("row1",), ("row2",)], [("row3",)], []]
+
+    rows = utils.iter_rows(
+        cur=mock_cursor,
+        query="SELECT * FROM table",
+        batch_size=2
+    )
+
+    mock_cursor.execute.assert_not_called()
+    assert next(rows) == ("row1",)
+    mock_cursor.execute.assert_called_once_with("SELECT * FROM table")
+    assert list(rows) == [("row2",), ("row3",)]
+    mock_cursor.fetchmany.assert_called_with(2)
+
+
+def test_iter_rows_propagates_fetch_errors():
+    mock_cursor = MagicMock()
+    original = psycopg2.OperationalError("connection lost")
+    mock_cursor.fetchmany.side_effect = [[("row1",)], original]
+
+    rows = utils.iter_rows(cur=mock_cursor, query="SELECT * FROM table")
+
+    assert next(rows) == ("row1",)
+    with pytest.raises(psycopg2.OperationalError) as e:
+        next(rows)
+
+    assert e.value is original
+
+
+def test_iter_rows_server_side_uses_named_cursor():
+    mock_cursor = MagicMock()
+    named_cursor = mock_cursor.connection.cursor.return_value
+    named_cursor.fetchmany.side_effect = [[("row1",), ("row2",)], []]
+
+    rows = list(
+        utils.iter_rows(
+            cur=mock_cursor,
+            query="SELECT * FROM table",
+            batch_size=2,
+            server_side=True
+        )
+    )
+
+    assert rows == [("row1",), ("row2",)]
+    _, kwargs = mock_cursor.connection.cursor.call_args
+    assert kwargs["name"].startswith("nova_chunked_")
+    assert named_cursor.itersize == 2
+    named_cursor.execute.assert_called_once_with("SELECT * FROM table")
+    named_cursor.close.assert_called_once()
+    mock_cursor.execute.assert_not_called()
 
 
 def test_create_schema_success():
@@ -100,7 +440,9 @@ def test_create_schema_success():
     )
 
     mock_cursor.execute.assert_called_once_with(
-        'CREATE SCHEMA IF NOT EXISTS "myschema";'
+        sql.SQL("CREATE SCHEMA IF NOT EXISTS {};").format(
+            sql.Identifier("myschema")
+        )
     )
 
 
@@ -115,3 +457,144 @@ def test_create_schema_failure():
         )
 
     assert "Error creating schema 'myschema'" in str(e.value)
+
+
+def test_fetch_in_chunks_streams_from_named_cursor():
+    mock_cursor = MagicMock()
+    named_cursor = mock_cursor.connection.cursor.return_value
+    named_cursor.description = [("id",), ("name",)]
+    named_cursor.fetchmany.side_effect = [
+        [(1, "a"), (2, "b")],
+        [(3, "c")],
+        [],
+    ]
+
+    cols, batches = utils.fetch_in_chunks(
+        cur=mock_cursor,
+        query="SELECT * FROM table",
+        table_name="table",
+        batch_size=2
+    )
+
+    assert cols == ["id", "name"]
+    assert mock_cursor.connection.cursor.call_args.kwargs["name"]
+    named_cursor.execute.assert_called_once_with("SELECT * FROM table")
+    named_cursor.close.assert_not_called()
+
+    assert list(batches) == [[(1, "a"), (2, "b")], [(3, "c")]]
+    named_cursor.fetchmany.assert_called_with(2)
+    named_cursor.close.assert_called_once()
+    mock_cursor.execute.assert_not_called()
+
+
+def test_fetch_in_chunks_propagates_errors_and_closes_cursor():
+    mock_cursor = MagicMock()
+    named_cursor = mock_cursor.connection.cursor.return_value
+    original = psycopg2.errors.UndefinedTable("missing table")
+    named_cursor.execute.side_effect = original
+
+    with pytest.raises(psycopg2.errors.UndefinedTable) as e:
+        utils.fetch_in_chunks(
+            cur=mock_cursor,
+            query="SELECT * FROM missing",
+            table_name="missing"
+        )
+
+    assert e.value is original
+    named_cursor.close.assert_called_once()
+
+
+def test_fetch_arrow_builds_typed_table():
+    pa = pytest.importorskip("pyarrow")
+
+    mock_cursor = MagicMock()
+    mock_cursor.description = [("id", 20), ("code", 25)]
+    mock_cursor.copy_expert.side_effect = (
+        lambda sql, file: file.write(b'id,code\n1,001\n2,""\n3,\n')
+    )
+
+    table = utils.fetch_arrow(cur=mock_cursor, query="SELECT id, code FROM t;")
+
+    assert table.schema.field("id").type == pa.int64()
+    assert table.schema.field("code").type == pa.string()
+    assert table.to_pydict() == {"id": [1, 2, 3], "code": ["001", "", None]}
+
+
+def test_fetch_arrow_keeps_numeric_precision():
+    pa = pytest.importorskip("pyarrow")
+
+    mock_cursor = MagicMock()
+    mock_cursor.description = [
+        ("price", 1700, None, 22, 22, 2, None),
+        ("total", 1700, None, -1, 65535, 65535, None),
+    ]
+    mock_cursor.copy_expert.side_effect = lambda sql, file: file.write(
+        b"price,total\n12345678901234567890.12,12345678901234567890.12\n"
+    )
+
+    table = utils.fetch_arrow(cur=mock_cursor, query="SELECT * FROM t")
+
+    assert table.schema.field("price").type == pa.decimal128(22, 2)
+    assert table.to_pydict() == {
+        "price": [Decimal("12345678901234567890.12")],
+        "total": ["12345678901234567890.12"],
+    }
+
+
+def test_fetch_arrow_adbc_returns_driver_table():
+    adbc = MagicMock()
+    modules = {
+        "adbc_driver_postgresql": adbc,
+        "adbc_driver_postgresql.dbapi": adbc.dbapi,
+    }
+    conn = adbc.dbapi.connect.return_value.__enter__.return_value
+    adbc_cursor = conn.cursor.return_value.__enter__.return_value
+
+    with patch.dict("sys.modules", modules):
+        table = utils.fetch_arrow_adbc(
+            database_url="fake_url",
+            query="SELECT 1"
+        )
+
+    adbc.dbapi.connect.assert_called_once_with("fake_url")
+    adbc_cursor.execute.assert_called_once_with("SELECT 1")
+    assert table is adbc_cursor.fetch_arrow_table.return_value
+
+
+def test_create_schema_error_keeps_original_cause():
+    mock_cursor = MagicMock()
+    original = psycopg2.errors.InsufficientPrivilege("permission denied")
+    mock_cursor.execute.side_effect = original
+
+    with pytest.raises(RuntimeError) as e:
+        utils.create_schema(cur=mock_cursor, schema_name="myschema")
+
+    assert "Error creating schema 'myschema'" in str(e.value)
+    assert e.value.__cause__ is original
+
+
+def test_estimate_table_rows_is_cached_per_connection():
+    mock_cursor = MagicMock()
+    mock_cursor.fetchone.return_value = (42,)
+
+    first = utils.estimate_table_rows(cur=mock_cursor, table_name="prices")
+    second = utils.estimate_table_rows(cur=mock_cursor, table_name="prices")
+
+    assert first == second == 42
+    mock_cursor.execute.assert_called_once()
+
+
+def test_estimate_table_rows_schema_qualified():
+    mock_cursor = MagicMock()
+    mock_cursor.fetchone.return_value = None
+
+    estimate = utils.estimate_table_rows(
+        cur=mock_cursor,
+        table_name="prices",
+        schema_name="market"
+    )
+
+    assert estimate == 100_000
+    query, params = mock_cursor.execute.call_args[0]
+    assert "pg_namespace" in query
+    assert params == ("market", "prices")